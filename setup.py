@@ -15,15 +15,20 @@ setup(
         "openai>=1.12.0",
         "fastapi>=0.110.0",
         "uvicorn[standard]>=0.25.0",
+        "orjson>=3.9.10",
         "pyobjc-framework-Quartz>=10.1",
         "pyobjc-framework-Cocoa>=10.1",
+        "pyobjc-framework-libdispatch>=10.1",
         "sqlite-utils>=3.36",
+        "zstandard>=0.23.0",
         "sentence-transformers>=2.2.2",
+        "hf_transfer>=0.1.4",
         "chromadb>=0.4.22",
         "numpy>=1.26.2",
         "aiofiles>=23.2.1",
         "python-dateutil>=2.8.2",
         "psutil>=5.9.6",
+        "blake3>=0.4.1",
         "structlog>=23.2.0",
     ],
     extras_require={
@@ -39,6 +44,7 @@ setup(
     entry_points={
         "console_scripts": [
             "second-brain=second_brain.cli:main",
+            "second-brain-api=second_brain.api.server:serve",
         ],
     },
     classifiers=[
@@ -6,19 +6,28 @@ packages whose APIs changed underneath pinned dependencies.
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 import shutil
+import sys
 import warnings
 
 logger = logging.getLogger(__name__)
 
 
+def _configure_hf_runtime() -> None:
+    """Use the Rust hf_transfer downloader for model weights when available."""
+    # huggingface_hub errors out if the flag is set without the package present.
+    if importlib.util.find_spec("hf_transfer") is None:
+        return
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
 def _ensure_huggingface_cached_download() -> None:
     """Restore deprecated huggingface_hub.cached_download for sentence-transformers."""
     try:
         import huggingface_hub
-        from huggingface_hub import hf_hub_download  # type: ignore
     except Exception:  # pragma: no cover - only executes when deps missing
         return
 
@@ -47,6 +56,9 @@ def _ensure_huggingface_cached_download() -> None:
         local_dir_use_symlinks: bool | str = "auto",
     ) -> str:
         """Compatibility wrapper routed to hf_hub_download."""
+        # Resolved on first call (a model download) rather than at patch time.
+        from huggingface_hub import hf_hub_download  # type: ignore
+
         if use_auth_token is not None and token is None:
             token = use_auth_token
 
@@ -104,4 +116,56 @@ def _ensure_huggingface_cached_download() -> None:
     )
 
 
-_ensure_huggingface_cached_download()
+class _PostImportHook:
+    """Meta path finder that runs a callback right after a module is imported.
+
+    Lets shims patch a package only in processes that actually import it,
+    instead of importing it eagerly at interpreter startup.
+    """
+
+    def __init__(self, module_name: str, callback) -> None:
+        self._module_name = module_name
+        self._callback = callback
+        self._resolving = False
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != self._module_name or self._resolving:
+            return None
+
+        self._resolving = True
+        try:
+            spec = importlib.util.find_spec(fullname)
+        finally:
+            self._resolving = False
+        if spec is None or spec.loader is None:
+            return None
+
+        exec_module = spec.loader.exec_module
+        hook = self
+
+        def exec_and_patch(module) -> None:
+            exec_module(module)
+            if hook in sys.meta_path:
+                sys.meta_path.remove(hook)
+            hook._callback()
+
+        spec.loader.exec_module = exec_and_patch  # type: ignore[method-assign]
+        return spec
+
+
+def _install_shims() -> None:
+    """Register compatibility shims unless disabled via SECOND_BRAIN_SKIP_SHIMS."""
+    if os.environ.get("SECOND_BRAIN_SKIP_SHIMS", "").lower() in ("1", "true", "yes"):
+        return
+
+    _configure_hf_runtime()
+
+    if "huggingface_hub" in sys.modules:
+        _ensure_huggingface_cached_download()
+    elif importlib.util.find_spec("huggingface_hub") is not None:
+        sys.meta_path.insert(
+            0, _PostImportHook("huggingface_hub", _ensure_huggingface_cached_download)
+        )
+
+
+_install_shims()
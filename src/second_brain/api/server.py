@@ -2,26 +2,90 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from ..config import Config
-from ..database import Database
+
+if TYPE_CHECKING:
+    from ..database import Database
 
 config = Config()
 
 
+def __getattr__(name: str):
+    """Resolve heavyweight module attributes on first access (PEP 562).
+
+    ``app`` is only built when something (uvicorn, ``serve``) asks for it, so
+    importing ``create_app`` from the CLI doesn't construct a throwaway app.
+    """
+    if name == "app":
+        value = create_app()
+    elif name == "Database":
+        from ..database import Database as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _iso_timestamp(timestamp: int) -> str:
+    """Format a unix timestamp as a local ISO-8601 string (cached)."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _decorate_frame(frame: dict) -> dict:
+    """Add derived display fields to a frame row in place."""
+    frame["iso_timestamp"] = _iso_timestamp(frame["timestamp"])
+    frame["screenshot_url"] = "/frames/" + frame["file_path"]
+    return frame
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """Gzip responses except frame images, which are already compressed."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/frames/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """Static files whose content never changes once written.
+
+    Frame paths encode their capture time down to the millisecond, so a
+    given URL always refers to the same image and browsers may cache it
+    indefinitely.
+    """
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers.setdefault(
+                "Cache-Control", "public, max-age=31536000, immutable"
+            )
+        return response
+
+
 def create_app() -> FastAPI:
     """Create the FastAPI application."""
     app = FastAPI(
         title="Second Brain API",
         description="Local API for timeline visualization and search",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
@@ -31,17 +95,39 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(APIGZipMiddleware, minimum_size=1024, compresslevel=5)
 
     frames_dir = config.get_frames_dir()
     frames_dir.mkdir(parents=True, exist_ok=True)
-    app.mount("/frames", StaticFiles(directory=str(frames_dir)), name="frames")
-
-    def get_db() -> Generator[Database, None, None]:
-        db = Database(config=config)
-        try:
-            yield db
-        finally:
-            db.close()
+    app.mount("/frames", ImmutableStaticFiles(directory=str(frames_dir)), name="frames")
+
+    # Make sure the schema exists so request handlers can open read-only
+    # connections; the API itself never writes.
+    from ..database import Database
+
+    Database(config=config).close()
+
+    # One connection per threadpool worker, opened on first use and reused
+    # across requests; sqlite3 connections may not hop between threads.
+    db_local = threading.local()
+    open_dbs: List[Database] = []
+    open_dbs_lock = threading.Lock()
+
+    def get_db() -> Database:
+        db = getattr(db_local, "db", None)
+        if db is None:
+            db = Database(config=config, read_only=True)
+            db_local.db = db
+            with open_dbs_lock:
+                open_dbs.append(db)
+        return db
+
+    @app.on_event("shutdown")
+    def close_dbs() -> None:
+        with open_dbs_lock:
+            for db in open_dbs:
+                db.close()
+            open_dbs.clear()
 
     @app.get("/api/frames")
     def list_frames(
@@ -49,33 +135,47 @@ def create_app() -> FastAPI:
         app_bundle_id: Optional[str] = Query(None),
         start: Optional[int] = Query(None, description="Start timestamp (unix seconds)"),
         end: Optional[int] = Query(None, description="End timestamp (unix seconds)"),
+        before: Optional[int] = Query(
+            None, description="Page cursor: return frames older than this timestamp"
+        ),
+        before_frame_id: Optional[str] = Query(
+            None, description="Page cursor: frame at `before` to continue after"
+        ),
         db: Database = Depends(get_db),
     ):
-        frames = db.get_frames(
-            limit=limit,
-            app_bundle_id=app_bundle_id,
-            start_timestamp=start,
-            end_timestamp=end,
-        )
-        response = []
-        for frame in frames:
-            response.append(
-                {
-                    **frame,
-                    "iso_timestamp": datetime.fromtimestamp(frame["timestamp"]).isoformat(),
-                    "screenshot_url": f"/frames/{frame['file_path']}",
-                }
+        if before is not None:
+            frames = db.get_frames_before(
+                before,
+                limit=limit,
+                app_bundle_id=app_bundle_id,
+                before_frame_id=before_frame_id,
+                start_timestamp=start,
+            )
+        else:
+            frames = db.get_frames(
+                limit=limit,
+                app_bundle_id=app_bundle_id,
+                start_timestamp=start,
+                end_timestamp=end,
             )
-        return {"frames": response}
+        # Cursor for the next (older) page, if this one was full
+        next_page = None
+        if len(frames) == limit:
+            last = frames[-1]
+            next_page = {"before": last["timestamp"], "before_frame_id": last["frame_id"]}
+        # Rows are plain JSON-safe dicts; hand them straight to orjson rather
+        # than walking them again through jsonable_encoder.
+        return ORJSONResponse({
+            "frames": [_decorate_frame(frame) for frame in frames],
+            "next": next_page,
+        })
 
     @app.get("/api/frames/{frame_id}")
     def get_frame(frame_id: str, db: Database = Depends(get_db)):
         frame = db.get_frame(frame_id)
         if not frame:
             raise HTTPException(status_code=404, detail="Frame not found")
-        frame["iso_timestamp"] = datetime.fromtimestamp(frame["timestamp"]).isoformat()
-        frame["screenshot_url"] = f"/frames/{frame['file_path']}"
-        return frame
+        return _decorate_frame(frame)
 
     @app.get("/api/frames/{frame_id}/text")
     def get_frame_text(frame_id: str, db: Database = Depends(get_db)):
@@ -103,4 +203,16 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+def serve() -> None:
+    """Run the API with uvloop/httptools across multiple worker processes."""
+    import uvicorn
+
+    uvicorn.run(
+        f"{__name__}:app",
+        host=config.get("api.host", "127.0.0.1"),
+        port=config.get("api.port", 8000),
+        workers=config.get("api.workers", os.cpu_count() or 1),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
@@ -24,6 +24,7 @@ class ActivityMonitor:
         idle_threshold_seconds: float = 30.0,
         active_fps: float = 1.0,
         idle_fps: float = 0.2,
+        poll_interval_seconds: float = 0.5,
     ):
         """Initialize activity monitor.
         
@@ -31,12 +32,18 @@ class ActivityMonitor:
             idle_threshold_seconds: Seconds of inactivity before considered idle
             active_fps: FPS when user is active
             idle_fps: FPS when user is idle
+            poll_interval_seconds: Minimum time between HID idle-time queries
         """
         self.idle_threshold = idle_threshold_seconds
         self.active_fps = active_fps
         self.idle_fps = idle_fps
+        self.poll_interval = poll_interval_seconds
         self.last_activity_time = time.time()
         
+        # Last HID sample and the monotonic time it was taken
+        self._cached_idle_seconds = 0.0
+        self._cached_at: Optional[float] = None
+        
         logger.info(
             "activity_monitor_initialized",
             idle_threshold=idle_threshold_seconds,
@@ -50,16 +57,25 @@ class ActivityMonitor:
         Returns:
             Seconds since last input event
         """
+        now = time.monotonic()
+        if self._cached_at is not None and now - self._cached_at < self.poll_interval:
+            # Idle time grows linearly between samples, so extrapolate rather
+            # than calling back into the HID event system.
+            return self._cached_idle_seconds + (now - self._cached_at)
+        
         try:
             # Get seconds since last input event (keyboard or mouse)
             seconds = CGEventSourceSecondsSinceLastEventType(
                 kCGEventSourceStateHIDSystemState,
                 kCGAnyInputEventType
             )
-            return seconds
         except Exception as e:
             logger.error("failed_to_get_input_time", error=str(e))
             return 0.0
+        
+        self._cached_idle_seconds = seconds
+        self._cached_at = now
+        return seconds
     
     def is_user_active(self) -> bool:
         """Check if user is currently active.
@@ -1,30 +1,109 @@
 """Screen capture service for Second Brain."""
 
 import asyncio
-import json
+import fcntl
+import os
 import subprocess
+import threading
 import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
+import numpy as np
+import objc
+import orjson
 import psutil
 import structlog
+from AppKit import NSWorkspace
+from Foundation import NSURL
+from PIL import Image
 from Quartz import (
     CGWindowListCopyWindowInfo,
+    CGDataProviderCopyData,
     CGDisplayBounds,
+    CGImageDestinationAddImage,
+    CGImageDestinationCreateWithURL,
+    CGImageDestinationFinalize,
+    CGImageGetBytesPerRow,
+    CGImageGetDataProvider,
+    CGImageGetHeight,
+    CGImageGetWidth,
     CGMainDisplayID,
+    kCGImageDestinationLossyCompressionQuality,
+    kCGWindowListExcludeDesktopElements,
     kCGWindowListOptionOnScreenOnly,
     kCGNullWindowID,
 )
 
+try:
+    from Quartz import CGDisplayCreateImage
+except ImportError:  # Dropped from newer SDKs in favour of ScreenCaptureKit
+    CGDisplayCreateImage = None
+
 from ..config import Config
 from .frame_differ import FrameDiffer
 from .activity_monitor import ActivityMonitor
+from .display_change_monitor import DisplayChangeMonitor
 
 logger = structlog.get_logger()
 
+# Formats ImageIO encodes natively, mapped to their uniform type identifiers.
+_IMAGEIO_TYPES = {
+    "png": "public.png",
+    "jpg": "public.jpeg",
+    "jpeg": "public.jpeg",
+    "heic": "public.heic",
+    "tiff": "public.tiff",
+}
+
+# Formats screencapture cannot write itself; captured as PNG and re-encoded.
+_REENCODED_FORMATS = {"webp": "WEBP"}
+
+
+def _directory_size(path: str) -> int:
+    """Sum file sizes under ``path`` using scandir's cached directory entries."""
+    total_size = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        total_size += _directory_size(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return total_size
+
+
+def _cgimage_data(cg_image):
+    """Copy a CGImage's pixel buffer out of its data provider."""
+    return CGDataProviderCopyData(CGImageGetDataProvider(cg_image))
+
+
+def _cgimage_pixels(cg_image, data) -> np.ndarray:
+    """View a CGImage's 32-bit BGRX pixel buffer as an HxWx4 uint8 array."""
+    row_pixels = CGImageGetBytesPerRow(cg_image) // 4
+    pixels = np.frombuffer(data, dtype=np.uint8).reshape(-1, row_pixels, 4)
+    return pixels[:, :CGImageGetWidth(cg_image)]
+
+
+def _cgimage_to_pil(cg_image, data) -> Image.Image:
+    """Wrap a CGImage's 32-bit BGRX pixel buffer as a PIL RGB image."""
+    return Image.frombuffer(
+        "RGB",
+        (CGImageGetWidth(cg_image), CGImageGetHeight(cg_image)),
+        data,
+        "raw",
+        "BGRX",
+        CGImageGetBytesPerRow(cg_image),
+        1,
+    )
+
 
 class CaptureService:
     """Service for capturing screenshots and window metadata."""
@@ -45,13 +124,22 @@ class CaptureService:
         self.quality = self.config.get("capture.quality", 85)
         self.max_disk_usage_gb = self.config.get("capture.max_disk_usage_gb", 100)
         self.min_free_space_gb = self.config.get("capture.min_free_space_gb", 10)
+        self.max_disk_usage_bytes = self.max_disk_usage_gb * (1 << 30)
+        self.disk_check_interval = self.config.get("capture.disk_check_interval_seconds", 30.0)
+        self._can_encode_in_memory = (
+            self.format in _IMAGEIO_TYPES or self.format in _REENCODED_FORMATS
+        )
         
         # Smart capture - frame change detection
         self.enable_frame_diff = self.config.get("capture.enable_frame_diff", True)
         self.frame_differ: Optional[FrameDiffer] = None
         if self.enable_frame_diff:
             similarity_threshold = self.config.get("capture.similarity_threshold", 0.95)
-            self.frame_differ = FrameDiffer(similarity_threshold=similarity_threshold)
+            hash_algorithm = self.config.get("capture.hash_algorithm", "dhash")
+            self.frame_differ = FrameDiffer(
+                similarity_threshold=similarity_threshold,
+                hash_algorithm=hash_algorithm,
+            )
         
         # Adaptive FPS - adjust capture rate based on activity
         self.enable_adaptive_fps = self.config.get("capture.enable_adaptive_fps", True)
@@ -65,13 +153,36 @@ class CaptureService:
                 idle_fps=idle_fps,
             )
         
+        # Idle change detection - skip idle ticks while the screen is static
+        self.display_monitor: Optional[DisplayChangeMonitor] = None
+        if self.activity_monitor and self.config.get("capture.enable_display_change_detection", True):
+            self.display_monitor = DisplayChangeMonitor()
+        
         # State
         self.running = False
         self.frames_captured = 0
         self.frames_skipped = 0
+        self.idle_ticks_skipped = 0
         self.last_capture_time = 0.0
+        self._stop_event = asyncio.Event()
+        self._free_space_ok = True
+        self._disk_monitor_task: Optional[asyncio.Task] = None
         self._screen_resolution_cache: Optional[str] = None
-        self._frames_dir_usage_bytes = self._calculate_frames_dir_size()
+        self.window_info_ttl = self.config.get("capture.window_info_ttl_seconds", 2.0)
+        self._win_cache: Optional[Dict[str, Any]] = None
+        self._win_cache_mono = 0.0
+        self._win_cache_pid = -1
+        self._current_date = None
+        self._current_date_dir: Optional[Path] = None
+        self._meta_shard: Optional[BinaryIO] = None
+        self._meta_shard_dir: Optional[Path] = None
+        # Sized by a background scan so startup does not block on large trees;
+        # frames written meanwhile are added on top under the same lock.
+        self._frames_dir_usage_bytes = 0
+        self._usage_lock = threading.Lock()
+        threading.Thread(
+            target=self._scan_frames_dir_usage, name="frames-dir-scan", daemon=True
+        ).start()
         
         logger.info(
             "capture_service_initialized",
@@ -81,28 +192,75 @@ class CaptureService:
         )
 
     def _calculate_frames_dir_size(self) -> int:
-        """Calculate total size of frames directory once at startup."""
-        total_size = 0
+        """Calculate total size of the frames directory."""
         if not self.frames_dir.exists():
-            return total_size
-        for path in self.frames_dir.rglob("*"):
-            if path.is_file():
-                try:
-                    total_size += path.stat().st_size
-                except OSError:
-                    continue
-        return total_size
+            return 0
+        return _directory_size(str(self.frames_dir))
+
+    def _scan_frames_dir_usage(self) -> None:
+        """Add the existing frames directory size to the usage counter."""
+        start = time.monotonic()
+        total_size = self._calculate_frames_dir_size()
+        self._add_frames_dir_usage(total_size)
+        logger.debug(
+            "frames_dir_scanned",
+            size_gb=round(total_size / (1024 ** 3), 2),
+            duration_seconds=round(time.monotonic() - start, 2),
+        )
+
+    def _add_frames_dir_usage(self, size_bytes: int) -> None:
+        """Thread-safely account for bytes written under the frames directory."""
+        with self._usage_lock:
+            self._frames_dir_usage_bytes += size_bytes
+
+    def _refresh_environment(self) -> Tuple[Dict[str, Any], str]:
+        """Sample per-frame system state in a single autorelease pool.
+        
+        The frontmost window and screen resolution lookups both cross into
+        Objective-C; batching them drains the autoreleased objects they create
+        once per frame, which nothing else does in this process.
+        
+        Returns:
+            Tuple of (window info, screen resolution)
+        """
+        with objc.autorelease_pool():
+            window_info = self._get_active_window_info()
+            screen_resolution = self._get_screen_resolution()
+        return window_info, screen_resolution
+
+    def _get_frontmost_pid(self) -> int:
+        """Get the PID of the frontmost application, or -1 if unavailable."""
+        try:
+            app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            return app.processIdentifier() if app is not None else -1
+        except Exception:
+            return -1
 
     def _get_active_window_info(self) -> Dict[str, Any]:
         """Get information about the active window using macOS APIs.
+
+        The result is reused while the frontmost application is unchanged
+        and younger than ``window_info_ttl`` seconds, since walking the full
+        window list on every frame is the expensive part.
         
         Returns:
             Dictionary with window information
         """
+        frontmost_pid = self._get_frontmost_pid()
+        now = time.monotonic()
+        if (
+            self._win_cache is not None
+            and frontmost_pid != -1
+            and frontmost_pid == self._win_cache_pid
+            and now - self._win_cache_mono < self.window_info_ttl
+        ):
+            return self._win_cache
+
         try:
-            # Get list of all windows
+            # Onscreen windows only, skipping wallpaper and desktop icons
             window_list = CGWindowListCopyWindowInfo(
-                kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+                kCGWindowListOptionOnScreenOnly | kCGWindowListExcludeDesktopElements,
+                kCGNullWindowID,
             )
             
             # Find the frontmost window (layer 0)
@@ -110,24 +268,18 @@ class CaptureService:
                 if window.get("kCGWindowLayer", -1) == 0:
                     owner_name = window.get("kCGWindowOwnerName", "Unknown")
                     window_name = window.get("kCGWindowName", "")
-                    owner_pid = window.get("kCGWindowOwnerPID", 0)
-                    
-                    # Try to get bundle ID from process
-                    bundle_id = "unknown"
-                    try:
-                        process = psutil.Process(owner_pid)
-                        # Try to extract bundle ID from process info
-                        # This is a simplified approach
-                        bundle_id = f"com.{owner_name.lower().replace(' ', '')}"
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+                    bundle_id = f"com.{owner_name.lower().replace(' ', '')}"
                     
-                    return {
+                    info = {
                         "window_title": window_name or owner_name,
                         "app_name": owner_name,
                         "app_bundle_id": bundle_id,
                         "window_bounds": window.get("kCGWindowBounds", {}),
                     }
+                    self._win_cache = info
+                    self._win_cache_mono = now
+                    self._win_cache_pid = frontmost_pid
+                    return info
             
             return {
                 "window_title": "Unknown",
@@ -184,9 +336,31 @@ class CaptureService:
     def _check_disk_space(self) -> bool:
         """Check if there's enough disk space to continue capturing.
         
+        Free space comes from the periodic probe in ``_disk_monitor``; the
+        frames directory usage is tracked in memory and checked directly.
+        
         Returns:
             True if there's enough space, False otherwise
         """
+        if not self._free_space_ok:
+            return False
+        
+        if self._frames_dir_usage_bytes > self.max_disk_usage_bytes:
+            logger.warning(
+                "max_disk_usage_exceeded",
+                total_gb=self._frames_dir_usage_bytes / (1024 ** 3),
+                max_gb=self.max_disk_usage_gb,
+            )
+            return False
+        
+        return True
+
+    def _probe_free_space(self) -> bool:
+        """Check the volume holding the frames directory has enough free space.
+        
+        Returns:
+            True if free space is above the configured minimum
+        """
         try:
             # Get disk usage for the frames directory
             disk_usage = psutil.disk_usage(str(self.frames_dir))
@@ -203,23 +377,17 @@ class CaptureService:
                 )
                 return False
             
-            # Check cached usage of frames directory
-            total_gb = self._frames_dir_usage_bytes / (1024 ** 3)
-            
-            if total_gb > self.max_disk_usage_gb:
-                logger.warning(
-                    "max_disk_usage_exceeded",
-                    total_gb=total_gb,
-                    max_gb=self.max_disk_usage_gb,
-                )
-                return False
-            
             return True
             
         except Exception as e:
             logger.error("disk_space_check_failed", error=str(e))
             return True  # Continue on error
 
+    async def _disk_monitor(self):
+        """Refresh the free-space flag every ``disk_check_interval`` seconds."""
+        while not await self._wait_for_stop(self.disk_check_interval):
+            self._free_space_ok = self._probe_free_space()
+
     def _get_frame_path(self, timestamp: datetime) -> Path:
         """Get the file path for a frame.
         
@@ -229,14 +397,180 @@ class CaptureService:
         Returns:
             Path to save the frame
         """
-        # Create directory structure: YYYY/MM/DD/
-        date_dir = self.frames_dir / timestamp.strftime("%Y/%m/%d")
-        date_dir.mkdir(parents=True, exist_ok=True)
+        # Create directory structure: YYYY/MM/DD/, once per day
+        date = timestamp.date()
+        if date != self._current_date:
+            date_dir = self.frames_dir / timestamp.strftime("%Y/%m/%d")
+            date_dir.mkdir(parents=True, exist_ok=True)
+            self._current_date = date
+            self._current_date_dir = date_dir
         
         # Create filename: HH-MM-SS-mmm.png
-        filename = timestamp.strftime("%H-%M-%S-%f")[:-3] + f".{self.format}"
+        filename = (
+            f"{timestamp.hour:02d}-{timestamp.minute:02d}-{timestamp.second:02d}"
+            f"-{timestamp.microsecond // 1000:03d}.{self.format}"
+        )
+        
+        return self._current_date_dir / filename
+
+    def _append_metadata(self, date_dir: Path, metadata: Dict[str, Any]) -> int:
+        """Append a frame's metadata as one line of the day's NDJSON shard.
+
+        Args:
+            date_dir: Day directory the frame was written to
+            metadata: Frame metadata
+
+        Returns:
+            Number of bytes appended
+        """
+        if self._meta_shard_dir != date_dir:
+            self._close_meta_shard()
+            self._meta_shard = open(date_dir / "frames.ndjson", "ab")
+            self._meta_shard_dir = date_dir
+
+        line = orjson.dumps(metadata, option=orjson.OPT_APPEND_NEWLINE)
+        fd = self._meta_shard.fileno()
+        # O_APPEND alone is only atomic up to PIPE_BUF; lock for other writers.
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            self._meta_shard.write(line)
+            self._meta_shard.flush()
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        return len(line)
+
+    def _close_meta_shard(self) -> None:
+        """Close the open metadata shard, if any."""
+        if self._meta_shard is not None:
+            self._meta_shard.close()
+            self._meta_shard = None
+            self._meta_shard_dir = None
+
+    def _grab_display_image(self):
+        """Grab the main display into memory via CoreGraphics.
+        
+        Returns:
+            CGImage of the main display, or None if unavailable
+        """
+        if CGDisplayCreateImage is None:
+            return None
+        try:
+            return CGDisplayCreateImage(CGMainDisplayID())
+        except Exception as e:
+            logger.debug("display_grab_failed", error=str(e))
+            return None
+
+    def _grab_and_diff(self) -> Tuple[Any, Any, bool]:
+        """Grab the main display and compare it against the previous frame.
+        
+        Runs on a worker thread: the grab, the pixel copy and both hashes
+        take tens of milliseconds at Retina resolution.
+        
+        Returns:
+            Tuple of (CGImage or None if unavailable, its copied pixel data
+            or None if not yet copied, whether the frame changed)
+        """
+        with objc.autorelease_pool():
+            cg_image = self._grab_display_image()
+            if cg_image is None or not self.frame_differ:
+                return cg_image, None, True
+            data = _cgimage_data(cg_image)
+            changed = self.frame_differ.should_capture_pixels(_cgimage_pixels(cg_image, data))
+            return cg_image, data, changed
+
+    def _write_display_image(self, cg_image, data, frame_path: Path) -> bool:
+        """Encode an in-memory display image to disk.
+        
+        Args:
+            cg_image: CGImage of the display
+            data: Pixel data already copied from ``cg_image``, or None
+            frame_path: Destination path
+            
+        Returns:
+            True if the frame was written
+        """
+        uti = _IMAGEIO_TYPES.get(self.format)
+        if uti:
+            # Runs on a worker thread, which has no autorelease pool of its own
+            with objc.autorelease_pool():
+                destination = CGImageDestinationCreateWithURL(
+                    NSURL.fileURLWithPath_(str(frame_path)), uti, 1, None
+                )
+                if destination is None:
+                    return False
+                CGImageDestinationAddImage(
+                    destination,
+                    cg_image,
+                    {kCGImageDestinationLossyCompressionQuality: self.quality / 100},
+                )
+                return bool(CGImageDestinationFinalize(destination))
+        
+        if data is None:
+            data = _cgimage_data(cg_image)
+        _cgimage_to_pil(cg_image, data).save(frame_path, _REENCODED_FORMATS[self.format], quality=self.quality, method=4)
+        return True
+
+    def _reencode_capture(self, capture_path: Path, frame_path: Path, pil_format: str) -> None:
+        """Re-encode a screencapture PNG into the configured format.
+        
+        Args:
+            capture_path: PNG written by screencapture, removed on success
+            frame_path: Destination path
+            pil_format: PIL format name to encode with
+        """
+        with Image.open(capture_path) as img:
+            # method=4 is within a few percent of method=6's size
+            # at a fraction of the encode time.
+            img.save(frame_path, pil_format, quality=self.quality, method=4)
+        capture_path.unlink()
+
+    async def _run_screencapture(self, frame_path: Path) -> Optional[Path]:
+        """Capture the screen with the screencapture CLI.
+        
+        Args:
+            frame_path: Destination path for the frame
+            
+        Returns:
+            Path the frame was written to, or None if capture failed
+        """
+        # Let screencapture write the target format directly when it can
+        # (png, jpg, heic, tiff, ...); only re-encode formats it lacks.
+        pil_format = _REENCODED_FORMATS.get(self.format)
+        if pil_format:
+            capture_path = frame_path.with_suffix(".png")
+            capture_type = "png"
+        else:
+            capture_path = frame_path
+            capture_type = "jpg" if self.format == "jpeg" else self.format
+
+        process = await asyncio.create_subprocess_exec(
+            "screencapture", "-x", "-t", capture_type, str(capture_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            returncode = await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.error("screencapture_timeout")
+            return None
+        
+        if returncode != 0:
+            logger.error("screencapture_failed", returncode=returncode)
+            return None
         
-        return date_dir / filename
+        if pil_format:
+            try:
+                await asyncio.to_thread(
+                    self._reencode_capture, capture_path, frame_path, pil_format
+                )
+            except Exception as e:
+                logger.error("frame_reencode_failed", format=self.format, error=str(e))
+                # Fall back to the captured PNG
+                return capture_path
+        
+        return frame_path
 
     async def capture_frame(self) -> Optional[Dict[str, Any]]:
         """Capture a single frame with metadata.
@@ -258,48 +592,38 @@ class CaptureService:
         frame_path = self._get_frame_path(timestamp)
         
         try:
-            # Capture screenshot using screencapture (always outputs PNG)
-            temp_png_path = frame_path.with_suffix('.png')
-            result = subprocess.run(
-                ["screencapture", "-x", str(temp_png_path)],
-                capture_output=True,
-                timeout=5,
-            )
-            
-            if result.returncode != 0:
-                logger.error("screencapture_failed", returncode=result.returncode)
-                return None
-            
-            # Convert to WebP if format is webp
-            if self.format == "webp":
-                try:
-                    from PIL import Image
-                    img = Image.open(temp_png_path)
-                    img.save(frame_path, 'WEBP', quality=self.quality, method=6)
-                    temp_png_path.unlink()  # Delete temp PNG
-                except Exception as e:
-                    logger.error("webp_conversion_failed", error=str(e))
-                    # Fall back to PNG
-                    frame_path = temp_png_path
+            cg_image, data, changed = None, None, True
+            if self._can_encode_in_memory:
+                # Compare the frame while it is still in memory so skipped
+                # frames are never encoded or written to disk.
+                cg_image, data, changed = await asyncio.to_thread(self._grab_and_diff)
+            if cg_image is not None:
+                if not changed:
+                    self.frames_skipped += 1
+                    return None
+                # Encoding takes tens of milliseconds at Retina resolution;
+                # keep it off the event loop.
+                if not await asyncio.to_thread(self._write_display_image, cg_image, data, frame_path):
+                    logger.error("frame_encode_failed", format=self.format)
+                    return None
             else:
-                frame_path = temp_png_path
-            
-            # Check if frame should be kept (frame change detection)
-            if self.frame_differ and not self.frame_differ.should_capture_frame(frame_path):
-                # Frame is too similar to previous - delete it and skip
-                frame_path.unlink()
-                self.frames_skipped += 1
-                return None
+                frame_path = await self._run_screencapture(frame_path)
+                if frame_path is None:
+                    return None
+                
+                # Check if frame should be kept (frame change detection)
+                if self.frame_differ and not self.frame_differ.should_capture_frame(frame_path):
+                    # Frame is too similar to previous - delete it and skip
+                    frame_path.unlink()
+                    self.frames_skipped += 1
+                    return None
             
             # Get file size
             file_size = frame_path.stat().st_size
-            self._frames_dir_usage_bytes += file_size
+            self._add_frames_dir_usage(file_size)
             
-            # Get window info
-            window_info = self._get_active_window_info()
-            
-            # Get screen resolution
-            screen_resolution = self._get_screen_resolution()
+            # Get window info and screen resolution
+            window_info, screen_resolution = self._refresh_environment()
             
             # Create metadata
             metadata = {
@@ -314,14 +638,8 @@ class CaptureService:
                 "screen_resolution": screen_resolution,
             }
             
-            # Save metadata JSON
-            metadata_path = frame_path.with_suffix(".json")
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
-            try:
-                self._frames_dir_usage_bytes += metadata_path.stat().st_size
-            except OSError:
-                pass
+            # Append metadata to the day's shard
+            self._add_frames_dir_usage(self._append_metadata(frame_path.parent, metadata))
             
             self.frames_captured += 1
             self.last_capture_time = time.time()
@@ -335,44 +653,83 @@ class CaptureService:
             
             return metadata
             
-        except subprocess.TimeoutExpired:
-            logger.error("screencapture_timeout")
-            return None
         except Exception as e:
             logger.error("capture_failed", error=str(e))
             return None
 
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Sleep for up to ``timeout`` seconds, waking early on stop().
+        
+        Returns:
+            True if stop was requested
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _should_capture_tick(self) -> bool:
+        """Check whether this loop tick should capture a frame.
+        
+        While the user is idle, ticks are skipped unless the display stream
+        reported new content, avoiding a full grab and hash of a static screen.
+        
+        Returns:
+            True if a frame should be captured
+        """
+        if not self.display_monitor or not self.activity_monitor:
+            return True
+        if self.activity_monitor.is_user_active():
+            return True
+        return self.display_monitor.consume_change()
+
     async def capture_loop(self):
         """Main capture loop that runs continuously with adaptive FPS."""
         logger.info("capture_loop_started", fps=self.fps, adaptive_fps=self.enable_adaptive_fps)
         self.running = True
+        self._stop_event.clear()
+        self._free_space_ok = self._probe_free_space()
+        self._disk_monitor_task = asyncio.create_task(self._disk_monitor())
+        if self.display_monitor:
+            self.display_monitor.start()
         
+        # Frames are scheduled on cumulative deadlines so per-iteration
+        # overhead does not accumulate as drift over long runs.
+        next_deadline = time.monotonic()
         while self.running:
-            loop_start = time.time()
+            # Capture frame
+            if self._should_capture_tick():
+                await self.capture_frame()
+            else:
+                self.idle_ticks_skipped += 1
             
             # Get current FPS (adaptive or fixed)
             current_fps = self.fps
             if self.activity_monitor:
                 current_fps = self.activity_monitor.get_adaptive_fps()
-            
             interval = 1.0 / current_fps
             
-            # Capture frame
-            await self.capture_frame()
-            
-            # Calculate sleep time to maintain FPS
-            elapsed = time.time() - loop_start
-            sleep_time = max(0, interval - elapsed)
-            
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+            next_deadline += interval
+            delay = next_deadline - time.monotonic()
+            if delay < -interval:
+                # Fell more than a frame behind (e.g. slow capture); resync
+                next_deadline = time.monotonic()
+            elif delay > 0:
+                await self._wait_for_stop(delay)
         
+        self._disk_monitor_task.cancel()
+        self._disk_monitor_task = None
+        if self.display_monitor:
+            self.display_monitor.stop()
+        self._close_meta_shard()
         logger.info("capture_loop_stopped", total_frames=self.frames_captured, frames_skipped=self.frames_skipped)
 
     def stop(self):
         """Stop the capture loop."""
         logger.info("stopping_capture_service")
         self.running = False
+        self._stop_event.set()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get capture service statistics.
@@ -384,6 +741,7 @@ class CaptureService:
             "running": self.running,
             "frames_captured": self.frames_captured,
             "frames_skipped": self.frames_skipped,
+            "idle_ticks_skipped": self.idle_ticks_skipped,
             "fps": self.fps,
             "last_capture_time": self.last_capture_time,
             "uptime_seconds": time.time() - self.last_capture_time if self.last_capture_time > 0 else 0,
@@ -0,0 +1,121 @@
+"""Display change detection for idle capture.
+
+Uses a CGDisplayStream to learn when screen content changes, so idle ticks
+can skip capturing entirely while nothing on screen is updating.
+"""
+
+import threading
+
+import structlog
+from Quartz import (
+    CGDisplayStreamCreateWithDispatchQueue,
+    CGDisplayStreamStart,
+    CGDisplayStreamStop,
+    CGMainDisplayID,
+    kCGDisplayStreamFrameStatusFrameComplete,
+    kCGDisplayStreamMinimumFrameTime,
+    kCGDisplayStreamShowCursor,
+    kCVPixelFormatType_32BGRA,
+)
+
+try:
+    from dispatch import dispatch_queue_create
+except ImportError:  # pyobjc-framework-libdispatch not installed
+    dispatch_queue_create = None
+
+logger = structlog.get_logger()
+
+# The stream is only used as a change signal, so it renders to a thumbnail.
+_STREAM_WIDTH = 64
+_STREAM_HEIGHT = 36
+
+
+class DisplayChangeMonitor:
+    """Tracks whether the main display has changed since it was last checked."""
+
+    def __init__(self, min_frame_interval_seconds: float = 0.5):
+        """Initialize display change monitor.
+
+        Args:
+            min_frame_interval_seconds: Minimum time between stream updates
+        """
+        self.min_frame_interval = min_frame_interval_seconds
+        self._lock = threading.Lock()
+        # Treat the screen as changed until the stream says otherwise
+        self._changed = True
+        self._stream = None
+        self._queue = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the display stream is active."""
+        return self._stream is not None
+
+    def start(self) -> bool:
+        """Start the display stream.
+
+        Returns:
+            True if change notifications are available
+        """
+        if self._stream is not None:
+            return True
+        if dispatch_queue_create is None:
+            logger.info("display_change_monitor_unavailable", reason="libdispatch")
+            return False
+
+        try:
+            self._queue = dispatch_queue_create(b"second-brain.display-changes", None)
+            stream = CGDisplayStreamCreateWithDispatchQueue(
+                CGMainDisplayID(),
+                _STREAM_WIDTH,
+                _STREAM_HEIGHT,
+                kCVPixelFormatType_32BGRA,
+                {
+                    kCGDisplayStreamMinimumFrameTime: self.min_frame_interval,
+                    kCGDisplayStreamShowCursor: False,
+                },
+                self._queue,
+                self._on_frame,
+            )
+            if stream is None or CGDisplayStreamStart(stream) != 0:
+                logger.warning("display_change_monitor_start_failed")
+                return False
+        except Exception as e:
+            logger.error("display_change_monitor_start_failed", error=str(e))
+            return False
+
+        self._stream = stream
+        logger.info("display_change_monitor_started")
+        return True
+
+    def stop(self) -> None:
+        """Stop the display stream."""
+        if self._stream is None:
+            return
+        try:
+            CGDisplayStreamStop(self._stream)
+        except Exception as e:
+            logger.error("display_change_monitor_stop_failed", error=str(e))
+        self._stream = None
+        self._queue = None
+        with self._lock:
+            self._changed = True
+
+    def _on_frame(self, status, display_time, frame_surface, update_ref) -> None:
+        """Stream callback, invoked on the dispatch queue when content updates."""
+        if status == kCGDisplayStreamFrameStatusFrameComplete:
+            with self._lock:
+                self._changed = True
+
+    def consume_change(self) -> bool:
+        """Check whether the display changed since the last call.
+
+        Returns:
+            True if content changed, or if the stream is not running
+        """
+        if self._stream is None:
+            return True
+        with self._lock:
+            changed, self._changed = self._changed, False
+        return changed
+
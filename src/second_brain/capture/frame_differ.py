@@ -8,31 +8,105 @@ import hashlib
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import structlog
+from blake3 import blake3
 from PIL import Image
 import imagehash
 
 logger = structlog.get_logger()
 
+# Supported perceptual hash algorithms. dHash (gradient based) is cheaper than
+# pHash and, unlike aHash, robust to global brightness shifts such as dark mode.
+HASH_ALGORITHMS = {
+    "ahash": imagehash.average_hash,
+    "dhash": imagehash.dhash,
+    "phash": imagehash.phash,
+}
+
+# ITU-R BT.601 luma weights (x1000) in BGR order, matching macOS framebuffers.
+_BGR_LUMA_WEIGHTS = np.array([114, 587, 299], dtype=np.uint64)
+
+
+def dhash_pixels(pixels: np.ndarray, hash_size: int = 16, bgr: bool = True) -> np.ndarray:
+    """Compute a difference hash directly from an HxWxC uint8 pixel array.
+    
+    Vectorized replacement for imagehash.dhash: the frame is decimated 2x
+    (one sample per logical point on Retina displays), summed into a
+    hash_size x (hash_size + 1) grid of blocks, reduced to luma, and adjacent
+    columns are compared.
+    
+    Args:
+        pixels: Pixel array with at least three color channels
+        hash_size: Hash edge length in bits
+        bgr: Whether channels are in BGR (True) or RGB (False) order
+        
+    Returns:
+        Boolean array of shape (hash_size, hash_size)
+    """
+    pixels = pixels[::2, ::2, :3]
+    block_h = pixels.shape[0] // hash_size
+    block_w = pixels.shape[1] // (hash_size + 1)
+    if block_h == 0 or block_w == 0:
+        raise ValueError(f"Frame too small to hash: {pixels.shape[:2]}")
+    
+    pixels = pixels[:block_h * hash_size, :block_w * (hash_size + 1)]
+    rows = np.add.reduceat(
+        pixels, np.arange(0, pixels.shape[0], block_h), axis=0, dtype=np.uint32
+    )
+    blocks = np.add.reduceat(
+        rows, np.arange(0, pixels.shape[1], block_w), axis=1, dtype=np.uint32
+    )
+    weights = _BGR_LUMA_WEIGHTS if bgr else _BGR_LUMA_WEIGHTS[::-1]
+    luma = blocks.astype(np.uint64) @ weights
+    return luma[:, 1:] > luma[:, :-1]
+
+
+def _pixels_digest(pixels: np.ndarray) -> bytes:
+    """BLAKE3 digest of a pixel array, hashing row by row for strided views."""
+    if pixels.flags.c_contiguous:
+        return blake3(pixels).digest()
+    # Framebuffer views skip per-row padding; rows themselves are contiguous.
+    hasher = blake3()
+    for row in pixels:
+        hasher.update(np.ascontiguousarray(row))
+    return hasher.digest()
+
+
+def _hash_to_int(bits: np.ndarray) -> int:
+    """Pack a boolean hash array into a Python int for popcount comparisons."""
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
 
 class FrameDiffer:
     """Detects significant changes between frames."""
     
-    def __init__(self, similarity_threshold: float = 0.95):
+    def __init__(self, similarity_threshold: float = 0.95, hash_algorithm: str = "dhash"):
         """Initialize frame differ.
         
         Args:
             similarity_threshold: Threshold for considering frames similar (0-1)
                                 Higher = more similar required to skip
+            hash_algorithm: Perceptual hash to compare frames with
+                            ("ahash", "dhash" or "phash")
         """
+        if hash_algorithm not in HASH_ALGORITHMS:
+            raise ValueError(
+                f"Unknown hash algorithm {hash_algorithm!r}; "
+                f"expected one of {sorted(HASH_ALGORITHMS)}"
+            )
         self.similarity_threshold = similarity_threshold
-        self.last_hash: Optional[imagehash.ImageHash] = None
+        self.hash_algorithm = hash_algorithm
+        self._hash_func = HASH_ALGORITHMS[hash_algorithm]
+        self.last_hash: Optional[int] = None
+        self._last_exact_hash: Optional[bytes] = None
         self.frames_skipped = 0
         self.frames_captured = 0
         
         logger.info(
             "frame_differ_initialized",
-            similarity_threshold=similarity_threshold
+            similarity_threshold=similarity_threshold,
+            hash_algorithm=hash_algorithm,
         )
     
     def should_capture_frame(self, image_path: Path) -> bool:
@@ -45,46 +119,97 @@ class FrameDiffer:
             True if frame should be captured, False if it's too similar to previous
         """
         try:
-            # Load image and compute perceptual hash
-            img = Image.open(image_path)
-            current_hash = imagehash.average_hash(img, hash_size=16)
-            
-            # First frame - always capture
-            if self.last_hash is None:
-                self.last_hash = current_hash
-                self.frames_captured += 1
-                return True
+            with Image.open(image_path) as img:
+                return self.should_capture_image(img)
+        except Exception as e:
+            logger.error("frame_diff_check_failed", error=str(e))
+            # On error, capture the frame to be safe
+            return True
+    
+    def should_capture_image(self, img: Image.Image) -> bool:
+        """Determine if an in-memory frame should be captured.
+        
+        Args:
+            img: Current frame image
             
-            # Calculate similarity (0 = identical, higher = more different)
-            difference = current_hash - self.last_hash
-            max_difference = 256  # Maximum possible difference for 16x16 hash
-            similarity = 1.0 - (difference / max_difference)
+        Returns:
+            True if frame should be captured, False if it's too similar to previous
+        """
+        try:
+            if self.hash_algorithm == "dhash":
+                bits = dhash_pixels(np.asarray(img.convert("RGB")), bgr=False)
+            else:
+                bits = self._hash_func(img, hash_size=16).hash
+            return self._check_hash(_hash_to_int(bits))
+        except Exception as e:
+            logger.error("frame_diff_check_failed", error=str(e))
+            # On error, capture the frame to be safe
+            return True
+    
+    def should_capture_pixels(self, pixels: np.ndarray) -> bool:
+        """Determine if a raw BGR(A) framebuffer should be captured.
+        
+        Byte-identical repeats of the previous frame (a static screen) are
+        caught by a BLAKE3 digest before any perceptual hashing.
+        
+        Args:
+            pixels: HxWx4 uint8 array in BGRA/BGRX order
             
-            # If similarity is above threshold, skip this frame
-            if similarity >= self.similarity_threshold:
+        Returns:
+            True if frame should be captured, False if it's too similar to previous
+        """
+        try:
+            exact_hash = _pixels_digest(pixels)
+            if exact_hash == self._last_exact_hash:
                 self.frames_skipped += 1
-                logger.debug(
-                    "frame_skipped_similar",
-                    similarity=similarity,
-                    threshold=self.similarity_threshold,
-                    total_skipped=self.frames_skipped
-                )
                 return False
+            self._last_exact_hash = exact_hash
             
-            # Frame is different enough - capture it
+            if self.hash_algorithm == "dhash":
+                bits = dhash_pixels(pixels)
+            else:
+                img = Image.fromarray(np.ascontiguousarray(pixels[..., 2::-1]))
+                bits = self._hash_func(img, hash_size=16).hash
+            return self._check_hash(_hash_to_int(bits))
+        except Exception as e:
+            logger.error("frame_diff_check_failed", error=str(e))
+            # On error, capture the frame to be safe
+            return True
+    
+    def _check_hash(self, current_hash: int) -> bool:
+        """Compare a frame hash against the last captured frame."""
+        # First frame - always capture
+        if self.last_hash is None:
             self.last_hash = current_hash
             self.frames_captured += 1
+            return True
+        
+        # Hamming distance (0 = identical, higher = more different);
+        # int.bit_count() compiles down to a hardware popcount.
+        difference = (current_hash ^ self.last_hash).bit_count()
+        max_difference = 256  # Maximum possible difference for 16x16 hash
+        similarity = 1.0 - (difference / max_difference)
+        
+        # If similarity is above threshold, skip this frame
+        if similarity >= self.similarity_threshold:
+            self.frames_skipped += 1
             logger.debug(
-                "frame_captured_different",
+                "frame_skipped_similar",
                 similarity=similarity,
-                threshold=self.similarity_threshold
+                threshold=self.similarity_threshold,
+                total_skipped=self.frames_skipped
             )
-            return True
-            
-        except Exception as e:
-            logger.error("frame_diff_check_failed", error=str(e))
-            # On error, capture the frame to be safe
-            return True
+            return False
+        
+        # Frame is different enough - capture it
+        self.last_hash = current_hash
+        self.frames_captured += 1
+        logger.debug(
+            "frame_captured_different",
+            similarity=similarity,
+            threshold=self.similarity_threshold
+        )
+        return True
     
     def get_stats(self) -> dict:
         """Get frame differ statistics.
@@ -6,18 +6,32 @@ providing massive storage savings (99%+) while maintaining full functionality.
 
 import asyncio
 import json
-import subprocess
-import time
+import signal
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import structlog
 
 from ..config import Config
 
 logger = structlog.get_logger()
 
+# video.codec values mapped to ffmpeg encoders. The VideoToolbox encoders run
+# on the media engine and are rate-controlled by bitrate rather than CRF.
+VIDEO_CODECS = {
+    "h264_vt": "h264_videotoolbox",
+    "hevc_vt": "hevc_videotoolbox",
+    "libx264": "libx264",
+}
+
+# ffmpeg's segment muxer names files with strftime and can't create
+# directories, so segments are recorded flat under these names and moved to
+# videos/YYYY/MM/DD/HH-MM-SS.mp4 once finished.
+_SEGMENT_PATTERN = "%Y-%m-%d_%H-%M-%S.mp4"
+_SEGMENT_GLOB = "????-??-??_??-??-??.mp4"
+
+
 
 class VideoCaptureService:
     """Service for capturing screen directly to H.264 video segments."""
@@ -38,150 +52,208 @@ class VideoCaptureService:
         # Configuration
         self.segment_duration = self.config.get("video.segment_duration_minutes", 5) * 60
         self.fps = self.config.get("capture.fps", 1)
+        self.codec = self.config.get("video.codec", "h264_vt")
+        if self.codec not in VIDEO_CODECS:
+            raise ValueError(
+                f"Unknown video codec '{self.codec}', expected one of {sorted(VIDEO_CODECS)}"
+            )
+        self.bitrate_mbps = self.config.get("video.bitrate_mbps", 2)
         
         # State
         self.running = False
         self.current_process: Optional[asyncio.subprocess.Process] = None
         self.current_segment_path: Optional[Path] = None
-        self.segment_start_time: Optional[float] = None
         self.segments_created = 0
+        self._stop_event = asyncio.Event()
         
         logger.info(
             "video_capture_service_initialized",
             segment_duration_min=self.segment_duration / 60,
             fps=self.fps,
+            codec=self.codec,
         )
     
-    def _get_segment_path(self, timestamp: datetime) -> Path:
-        """Get path for a video segment.
+    def _encoder_args(self) -> List[str]:
+        """Get ffmpeg output arguments for the configured codec.
         
-        Args:
-            timestamp: Start timestamp for segment
-            
         Returns:
-            Path to video file
+            List of ffmpeg arguments selecting and tuning the encoder
         """
-        date_dir = self.video_dir / timestamp.strftime("%Y/%m/%d")
-        date_dir.mkdir(parents=True, exist_ok=True)
-        filename = timestamp.strftime("%H-%M-%S") + ".mp4"
-        return date_dir / filename
+        encoder = VIDEO_CODECS[self.codec]
+        if self.codec == "libx264":
+            return ["-c:v", encoder, "-preset", "ultrafast", "-crf", "23"]
+        
+        args = ["-c:v", encoder, "-b:v", f"{self.bitrate_mbps}M", "-realtime", "1"]
+        if self.codec == "hevc_vt":
+            # Tag as hvc1 so QuickTime and AVFoundation will play the file
+            args += ["-tag:v", "hvc1"]
+        return args
     
-    async def _start_new_segment(self, timestamp: datetime) -> bool:
-        """Start recording a new video segment.
+    async def _start_recorder(self) -> bool:
+        """Start a single ffmpeg process that rolls segments itself.
+        
+        The segment muxer cuts a new file every ``segment_duration`` seconds
+        without restarting the encoder or reacquiring the capture device, so
+        there is no gap in the recording between segments.
         
-        Args:
-            timestamp: Start time for segment
-            
         Returns:
             True if started successfully
         """
-        segment_path = self._get_segment_path(timestamp)
-        
         try:
-            # Use ffmpeg to record screen directly to H.264
-            # This captures the main display at specified FPS
             cmd = [
                 "ffmpeg",
+                "-nostats",
+                "-loglevel", "error",
                 "-f", "avfoundation",  # macOS screen capture
-                "-framerate", str(self.fps),
+                "-framerate", str(self.fps),  # Input option, must precede -i
                 "-i", "1:none",  # Capture display 1, no audio
-                "-c:v", "libx264",
-                "-preset", "ultrafast",  # Fast encoding for real-time
-                "-crf", "23",
+                *self._encoder_args(),
                 "-pix_fmt", "yuv420p",
-                "-t", str(self.segment_duration),  # Duration limit
+                "-f", "segment",
+                "-segment_time", str(self.segment_duration),
+                "-segment_format", "mp4",
+                "-reset_timestamps", "1",
+                "-strftime", "1",
                 "-y",
-                str(segment_path),
+                str(self.video_dir / _SEGMENT_PATTERN),
             ]
             
+            # Output is discarded: an unread pipe would eventually fill and
+            # stall a process that runs for the lifetime of the service.
             self.current_process = await asyncio.create_subprocess_exec(
                 *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
             
-            self.current_segment_path = segment_path
-            self.segment_start_time = time.time()
-            
             logger.info(
-                "video_segment_started",
-                path=str(segment_path),
+                "video_recorder_started",
+                pid=self.current_process.pid,
                 duration_min=self.segment_duration / 60,
             )
             
             return True
             
         except Exception as e:
-            logger.error("failed_to_start_segment", error=str(e))
+            logger.error("failed_to_start_recorder", error=str(e))
             return False
     
-    async def _finalize_segment(self) -> Optional[Path]:
-        """Finalize the current video segment.
+    async def _stop_recorder(self) -> None:
+        """Stop the ffmpeg recorder, letting it finalize the open segment."""
+        if not self.current_process:
+            return
+        
+        try:
+            if self.current_process.returncode is None:
+                # Send SIGINT to gracefully stop ffmpeg
+                self.current_process.send_signal(signal.SIGINT)
+                await self.current_process.wait()
+        except Exception as e:
+            logger.error("failed_to_stop_recorder", error=str(e))
+        finally:
+            self.current_process = None
+    
+    def _scan_segments(self, recorder_exited: bool = False) -> None:
+        """Record segments ffmpeg has finished writing since the last scan.
+        
+        Args:
+            recorder_exited: Whether ffmpeg has exited, in which case the
+                newest segment is complete as well
+        """
+        on_disk = sorted(self.video_dir.glob(_SEGMENT_GLOB))
+        in_progress = on_disk[-1] if on_disk and not recorder_exited else None
+        
+        for segment_path in on_disk:
+            if segment_path == in_progress:
+                continue
+            try:
+                size_mb = segment_path.stat().st_size / (1024 * 1024)
+                segment_path = self._file_segment(segment_path)
+            except OSError as e:
+                logger.error("failed_to_file_segment", path=str(segment_path), error=str(e))
+                continue
+            self.segments_created += 1
+            logger.info(
+                "video_segment_finalized",
+                path=str(segment_path),
+                size_mb=size_mb,
+            )
+        
+        self.current_segment_path = in_progress
+    
+    def _file_segment(self, segment_path: Path) -> Path:
+        """Move a finished segment into its day directory.
         
+        Args:
+            segment_path: Flat segment written by ffmpeg
+            
         Returns:
-            Path to finalized segment or None
+            Path of the segment under videos/YYYY/MM/DD/
         """
-        if not self.current_process or not self.current_segment_path:
-            return None
+        start = datetime.strptime(segment_path.name, _SEGMENT_PATTERN)
+        date_dir = self.video_dir / start.strftime("%Y/%m/%d")
+        date_dir.mkdir(parents=True, exist_ok=True)
+        return segment_path.rename(date_dir / start.strftime("%H-%M-%S.mp4"))
+    
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Sleep for up to ``timeout`` seconds, waking early on stop().
         
+        Returns:
+            True if stop was requested
+        """
         try:
-            # Send SIGINT to gracefully stop ffmpeg
-            self.current_process.send_signal(subprocess.signal.SIGINT)
-            
-            # Wait for process to finish
-            await self.current_process.wait()
-            
-            # Check if file was created
-            if self.current_segment_path.exists():
-                file_size = self.current_segment_path.stat().st_size
-                duration = time.time() - self.segment_start_time if self.segment_start_time else 0
-                
-                logger.info(
-                    "video_segment_finalized",
-                    path=str(self.current_segment_path),
-                    size_mb=file_size / (1024 * 1024),
-                    duration_sec=duration,
-                )
-                
-                segment_path = self.current_segment_path
-                self.segments_created += 1
-                
-                # Reset state
-                self.current_process = None
-                self.current_segment_path = None
-                self.segment_start_time = None
-                
-                return segment_path
-            
-            return None
-            
-        except Exception as e:
-            logger.error("failed_to_finalize_segment", error=str(e))
-            return None
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
     
     async def capture_loop(self):
-        """Main capture loop that records video segments."""
+        """Main capture loop that supervises the segmenting recorder."""
         logger.info("video_capture_loop_started")
         self.running = True
+        self._stop_event.clear()
+        # Segments left flat by an earlier run are complete; file them without
+        # counting them as created by this one
+        for segment_path in self.video_dir.glob(_SEGMENT_GLOB):
+            try:
+                self._file_segment(segment_path)
+            except OSError as e:
+                logger.error("failed_to_file_segment", path=str(segment_path), error=str(e))
         
         while self.running:
-            # Start new segment
-            timestamp = datetime.now()
-            if await self._start_new_segment(timestamp):
-                # Wait for segment duration or until stopped
-                start_time = time.time()
-                while self.running and (time.time() - start_time) < self.segment_duration:
-                    await asyncio.sleep(1)
-                
-                # Finalize segment
-                await self._finalize_segment()
-            else:
+            if not await self._start_recorder():
                 # Failed to start, wait and retry
-                await asyncio.sleep(5)
-        
-        # Finalize any remaining segment
-        if self.current_process:
-            await self._finalize_segment()
+                await self._wait_for_stop(5)
+                continue
+            
+            # Wake once per segment to pick up the one ffmpeg just rolled,
+            # or immediately if the recorder exits or stop() is called.
+            recorder_exit = asyncio.ensure_future(self.current_process.wait())
+            stop_requested = asyncio.ensure_future(self._stop_event.wait())
+            while True:
+                done, _ = await asyncio.wait(
+                    {recorder_exit, stop_requested},
+                    timeout=self.segment_duration,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if done:
+                    break
+                self._scan_segments()
+            stop_requested.cancel()
+            
+            if recorder_exit in done:
+                logger.warning(
+                    "video_recorder_exited",
+                    returncode=self.current_process.returncode,
+                )
+            
+            await self._stop_recorder()
+            recorder_exit.cancel()
+            self._scan_segments(recorder_exited=True)
+            
+            if self.running:
+                # Recorder died unexpectedly, back off before restarting
+                await self._wait_for_stop(5)
         
         logger.info("video_capture_loop_stopped", segments_created=self.segments_created)
     
@@ -189,6 +261,7 @@ class VideoCaptureService:
         """Stop the capture loop."""
         logger.info("stopping_video_capture_service")
         self.running = False
+        self._stop_event.set()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get capture statistics.
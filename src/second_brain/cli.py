@@ -1,136 +1,351 @@
 """Command-line interface for Second Brain."""
 
-import asyncio
-import json
+import atexit
+import functools
+import importlib
 import os
+import select
 import signal
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import click
-import psutil
-import structlog
-from dotenv import load_dotenv
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .config import Config
-from .database import Database
-# Lazy imports for heavy dependencies
-# from .pipeline import ProcessingPipeline
-# from .embeddings import EmbeddingService
+# Lazy imports for heavy dependencies: asyncio, psutil, structlog, dotenv, the
+# rest of rich, the database and the pipeline are imported by the commands
+# that need them, and larger commands live in the commands package (see
+# LazyGroup), keeping `stop` and `status` startup cheap.
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+    import psutil
+
+    from .database import Database
+
+_log_listener: Optional["QueueListener"] = None
+_psutil = None
+
+# Environment flags, resolved once in main() after .env has been loaded.
+# Set DEBUG=1 to see all logs including info and debug; by default only
+# warnings and errors are shown.
+_DEBUG = False
+_HAS_OPENAI = False
+
+
+def _get_psutil():
+    """Import psutil on first use and reuse the module afterwards."""
+    global _psutil
+    if _psutil is None:
+        import psutil as _psutil
+    return _psutil
+
+
+def _configure_logging() -> None:
+    """Configure structlog and start writing log lines to stdout."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    import logging
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    import structlog
+
+    # The filtering bound logger turns calls below the level into no-ops
+    # before any processor runs, instead of rendering events and then
+    # dropping them.
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            structlog.processors.JSONRenderer(),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.DEBUG if _DEBUG else logging.WARNING
+        ),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+    # Rendered log lines are handed to a queue and written to stdout by a
+    # listener thread, so logging call sites never block on the write.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    # Level filtering already happened in structlog
+    logging.getLogger(__package__).setLevel(logging.DEBUG)
+
+    _log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
-# Configure structlog with log level filtering
-def filter_by_level(logger, method_name, event_dict):
-    """Filter logs based on DEBUG environment variable.
-    
-    By default, only show warnings and errors.
-    Set DEBUG=1 to see all logs including info and debug.
-    """
-    if os.getenv("DEBUG", "").lower() in ("1", "true", "yes"):
-        return event_dict
-    
-    # Filter out debug and info level logs by default
-    level = event_dict.get("level")
-    if level in ("debug", "info"):
-        raise structlog.DropEvent
-    
-    return event_dict
-
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        filter_by_level,
-        structlog.processors.JSONRenderer(),
-    ],
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=True,
-)
 
 console = Console()
-logger = structlog.get_logger()
+
+# Display format for frame timestamps
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
+@functools.cache
 def get_pid_file() -> Path:
-    """Get path to PID file."""
+    """Get path to PID file; resolved once per process."""
     return Path.home() / "Library" / "Application Support" / "second-brain" / "second-brain.pid"
 
 
-def _read_pid_file(pid_file: Path) -> tuple[int, Optional[float]]:
-    """Read PID file and return PID with optional create time."""
-    pid_raw = pid_file.read_text().strip()
-    expected_create_time: Optional[float] = None
+def _read_pid_file(fd: int) -> int:
+    """Read the PID from an open PID file descriptor."""
+    data = os.read(fd, 64)
+    # Older PID files also carry the process create time after a colon
+    return int(data.strip().partition(b":")[0])
 
-    if ":" in pid_raw:
-        pid_part, create_time_part = pid_raw.split(":", 1)
-        pid = int(pid_part)
-        try:
-            expected_create_time = float(create_time_part)
-        except ValueError:
-            expected_create_time = None
-    else:
-        pid = int(pid_raw)
 
-    return pid, expected_create_time
+@functools.lru_cache(maxsize=1)
+def _service_process() -> Optional["psutil.Process"]:
+    """Get the running service process described by the PID file, if any.
 
+    The service holds an exclusive flock on the PID file for its lifetime, so
+    the file is live exactly when the lock cannot be taken. Without flock
+    (Windows) the PID is trusted if that process exists. The result is probed
+    once per command; anything that changes the service state clears the
+    cache.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
 
-def is_running() -> bool:
-    """Check if service is running."""
     pid_file = get_pid_file()
-    if not pid_file.exists():
-        return False
+    try:
+        fd = os.open(pid_file, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
 
     try:
-        pid, expected_create_time = _read_pid_file(pid_file)
-        process = psutil.Process(pid)
-        if expected_create_time is not None:
-            # Allow slight drift in floating point representation
-            if abs(process.create_time() - expected_create_time) > 0.5:
-                raise psutil.NoSuchProcess(pid)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                pass  # Held by the service
+            else:
+                # Nobody holds the lock, so the file is stale. Unlinking while
+                # holding it is safe: save_pid() re-creates a file it finds
+                # unlinked after locking.
+                pid_file.unlink(missing_ok=True)
+                return None
+        pid = _read_pid_file(fd)
+    except (ValueError, OSError):
+        # PID file is invalid
+        return None
+    finally:
+        os.close(fd)
+
+    psutil = _get_psutil()
+    try:
+        return psutil.Process(pid)
+    except psutil.Error:
+        return None
+
+
+def _wait_for_exit(process: "psutil.Process", timeout: float) -> bool:
+    """Wait for a process to exit, blocking on a kernel exit event if possible.
+
+    Uses a kqueue NOTE_EXIT filter on macOS/BSD and a pidfd on Linux, falling
+    back to psutil's polling wait elsewhere.
+
+    Args:
+        process: Process to wait for
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    psutil = _get_psutil()
 
+    pid = process.pid
+    try:
+        if hasattr(select, "kqueue"):
+            kq = select.kqueue()
+            try:
+                event = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                return bool(kq.control([event], 1, timeout))
+            finally:
+                kq.close()
+
+        fd = os.pidfd_open(pid)
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(fd)
+    except ProcessLookupError:
+        # Already gone before the exit event could be registered
         return True
-    except (ValueError, psutil.Error, OSError):
-        # Process doesn't exist or PID file is invalid
-        pid_file.unlink(missing_ok=True)
+    except (AttributeError, OSError):
+        pass  # No pidfd support; poll instead
+
+    try:
+        process.wait(timeout=timeout)
+    except psutil.TimeoutExpired:
         return False
+    return True
+
+
+def is_running() -> bool:
+    """Check if service is running."""
+    return _service_process() is not None
+
 
+# PID of the process that wrote the PID file from this interpreter, if any
+_saved_pid: Optional[int] = None
+# Descriptor of the PID file, kept open so the service lock lives as long as
+# the process
+_pid_fd: Optional[int] = None
+
+
+def save_pid() -> bool:
+    """Save current process PID and lock the PID file.
+
+    Returns:
+        False if another service instance holds the PID file
+    """
+    global _saved_pid, _pid_fd
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
 
-def save_pid():
-    """Save current process PID."""
     pid_file = get_pid_file()
     pid_file.parent.mkdir(parents=True, exist_ok=True)
-    process = psutil.Process(os.getpid())
-    payload = f"{process.pid}:{process.create_time()}"
-    with open(pid_file, "w") as f:
-        f.write(payload)
+    if fcntl is None:
+        # No flock (Windows): refuse only if the recorded process is alive
+        if _service_process() is not None:
+            return False
+        pid_file.write_text(str(os.getpid()))
+        _saved_pid = os.getpid()
+        _service_process.cache_clear()
+        return True
+
+    while True:
+        fd = os.open(pid_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        # A concurrent status check may have unlinked the stale file between
+        # open and flock; lock a fresh one in that case.
+        try:
+            if os.stat(pid_file).st_ino == os.fstat(fd).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _pid_fd = fd
+    _saved_pid = os.getpid()
+    _service_process.cache_clear()
+    return True
+
+
+@functools.cache
+def _db() -> "Database":
+    """Open the database on first use and share it for the rest of the process.
+
+    Commands only read, so the connection is read-only and never waits on
+    the capture service's writes. The schema is created first on a fresh
+    install.
+    """
+    from .database import Database
+
+    if not (Config.get_database_dir() / "memory.db").exists():
+        Database().close()
+    db = Database(read_only=True)
+    atexit.register(db.close)
+    return db
 
 
 def remove_pid():
     """Remove PID file."""
     pid_file = get_pid_file()
     pid_file.unlink(missing_ok=True)
+    _service_process.cache_clear()
+
+
+def _remove_pid_if_mine() -> None:
+    """Remove the PID file at exit if this process wrote it."""
+    if _saved_pid == os.getpid():
+        remove_pid()
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Command group that imports some commands only when they are invoked.
+
+    Service control commands live in this module. Commands with more code or
+    heavier dependencies live in the ``commands`` package, one module each, so
+    `start`, `stop` and `status` never load them.
+    """
+
+    def __init__(self, *args, lazy_commands: Dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> module in the commands package
+        self.lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_commands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        module_name = self.lazy_commands.get(cmd_name)
+        if module_name is None:
+            return super().get_command(ctx, cmd_name)
+        module = importlib.import_module(f".commands.{module_name}", __package__)
+        return getattr(module, module_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "query": "query",
+        "convert-to-video": "convert_to_video",
+        "timeline": "timeline",
+        "reset": "reset",
+    },
+)
 @click.version_option(version="0.1.0")
 def main():
     """Second Brain - Local-first visual memory capture and search."""
-    pass
+    global _DEBUG, _HAS_OPENAI
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+    _DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
+    _HAS_OPENAI = bool(os.environ.get("OPENAI_API_KEY"))
+    # Clean up a PID file written by this process however the command exits
+    atexit.register(_remove_pid_if_mine)
 
 
 @main.command()
 @click.option("--fps", type=float, help="Frames per second to capture")
 def start(fps: Optional[float]):
     """Start the capture service."""
+    import asyncio
+
+    _configure_logging()
+
     if is_running():
         console.print("[yellow]Service is already running[/yellow]")
         return
@@ -145,7 +360,9 @@ def start(fps: Optional[float]):
         config.set("capture.fps", fps)
     
     # Save PID
-    save_pid()
+    if not save_pid():
+        console.print("[yellow]Service is already running[/yellow]")
+        return
     
     # Lazy import heavy dependencies only when needed
     from .pipeline import ProcessingPipeline
@@ -153,16 +370,21 @@ def start(fps: Optional[float]):
     # Create pipeline
     pipeline = ProcessingPipeline(config)
     
-    # Setup signal handlers
-    def signal_handler(sig, frame):
+    def request_stop():
         console.print("\n[yellow]Stopping service...[/yellow]")
         asyncio.create_task(pipeline.stop())
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     # Start pipeline
     async def run():
+        # Setup signal handlers on the loop itself
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            if sys.platform != "win32":
+                loop.add_signal_handler(sig, request_stop)
+            else:
+                # No loop signal handlers on Windows; hop back onto the loop
+                signal.signal(sig, lambda *_: loop.call_soon_threadsafe(request_stop))
+        
         try:
             await pipeline.start()
             
@@ -178,47 +400,40 @@ def start(fps: Optional[float]):
             console.print("\n[yellow]Stopping service...[/yellow]")
         finally:
             await pipeline.stop()
-            remove_pid()
             console.print("[green]Service stopped[/green]")
     
     try:
         asyncio.run(run())
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
-        remove_pid()
         sys.exit(1)
 
 
 @main.command()
 def stop():
     """Stop the capture service."""
-    if not is_running():
+    psutil = _get_psutil()
+
+    process = _service_process()
+    if process is None:
         console.print("[yellow]Service is not running[/yellow]")
         return
 
-    pid_file = get_pid_file()
-    try:
-        pid, _ = _read_pid_file(pid_file)
-    except (OSError, ValueError):
-        console.print("[red]PID file is corrupted or missing[/red]")
-        remove_pid()
-        return
-    
+    pid = process.pid
     try:
         os.kill(pid, signal.SIGTERM)
+        _service_process.cache_clear()
         console.print(f"[green]✓[/green] Sent stop signal to process {pid}")
         
         # Wait for process to stop
-        import time
-        for _ in range(10):
-            if not is_running():
-                console.print("[green]Service stopped[/green]")
-                return
-            time.sleep(0.5)
+        if not _wait_for_exit(process, timeout=5):
+            console.print("[yellow]Service may still be stopping...[/yellow]")
+            return
         
-        console.print("[yellow]Service may still be stopping...[/yellow]")
+        remove_pid()
+        console.print("[green]Service stopped[/green]")
         
-    except OSError as e:
+    except (OSError, psutil.Error) as e:
         console.print(f"[red]Error stopping service: {e}[/red]")
         remove_pid()
 
@@ -226,6 +441,10 @@ def stop():
 @main.command()
 def status():
     """Show service status."""
+    from rich.table import Table
+
+    _configure_logging()
+
     if not is_running():
         console.print("[yellow]Service is not running[/yellow]")
         return
@@ -234,7 +453,7 @@ def status():
     
     # Get stats from database
     try:
-        db = Database()
+        db = _db()
         stats = db.get_database_stats()
         
         table = Table(title="Second Brain Status")
@@ -252,201 +471,25 @@ def status():
         
         if stats["oldest_frame_timestamp"]:
             oldest = datetime.fromtimestamp(stats["oldest_frame_timestamp"])
-            table.add_row("Oldest Frame", oldest.strftime("%Y-%m-%d %H:%M:%S"))
+            table.add_row("Oldest Frame", oldest.strftime(_TIMESTAMP_FORMAT))
         
         if stats["newest_frame_timestamp"]:
             newest = datetime.fromtimestamp(stats["newest_frame_timestamp"])
-            table.add_row("Newest Frame", newest.strftime("%Y-%m-%d %H:%M:%S"))
+            table.add_row("Newest Frame", newest.strftime(_TIMESTAMP_FORMAT))
         
         console.print(table)
         
-        db.close()
-        
     except Exception as e:
         console.print(f"[red]Error getting stats: {e}[/red]")
 
 
-@main.command()
-@click.argument("query")
-@click.option("--app", help="Filter by application bundle ID")
-@click.option("--from", "from_date", help="Start date (YYYY-MM-DD)")
-@click.option("--to", "to_date", help="End date (YYYY-MM-DD)")
-@click.option("--limit", default=10, help="Maximum number of results")
-@click.option("--semantic", is_flag=True, help="Use semantic vector search")
-def query(query: str, app: Optional[str], from_date: Optional[str], to_date: Optional[str], limit: int, semantic: bool):
-    """Search captured memory."""
-    console.print(f"[cyan]Searching for:[/cyan] {query}")
-    
-    # Parse dates
-    start_timestamp = None
-    end_timestamp = None
-    
-    if from_date:
-        try:
-            dt = datetime.strptime(from_date, "%Y-%m-%d")
-            start_timestamp = int(dt.timestamp())
-        except ValueError:
-            console.print(f"[red]Invalid from date format. Use YYYY-MM-DD[/red]")
-            return
-    
-    if to_date:
-        try:
-            dt = datetime.strptime(to_date, "%Y-%m-%d")
-            end_timestamp = int(dt.timestamp())
-        except ValueError:
-            console.print(f"[red]Invalid to date format. Use YYYY-MM-DD[/red]")
-            return
-    
-    # Search database
-    try:
-        db = Database()
-        
-        display_results = []
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task(description="Searching...", total=None)
-
-            if semantic:
-                # Lazy import heavy dependencies only when needed
-                from .embeddings import EmbeddingService
-                
-                embedding_service = EmbeddingService()
-                matches = embedding_service.search(
-                    query=query,
-                    limit=limit,
-                    app_filter=app,
-                )
-
-                for match in matches:
-                    frame = db.get_frame(match["frame_id"])
-                    if not frame:
-                        continue
-                    block = db.get_text_block(match["block_id"])
-                    if not block:
-                        continue
-                    display_results.append(
-                        {
-                            "window_title": frame.get("window_title") or "Untitled",
-                            "app_name": frame.get("app_name") or "Unknown",
-                            "timestamp": frame.get("timestamp"),
-                            "text": block.get("text", ""),
-                            "score": 1 - match.get("distance", 0.0) if match.get("distance") is not None else None,
-                            "method": "semantic",
-                        }
-                    )
-            else:
-                results = db.search_text(
-                    query=query,
-                    app_filter=app,
-                    start_timestamp=start_timestamp,
-                    end_timestamp=end_timestamp,
-                    limit=limit,
-                )
-                for result in results:
-                    display_results.append(
-                        {
-                            "window_title": result.get("window_title") or "Untitled",
-                            "app_name": result.get("app_name") or "Unknown",
-                            "timestamp": result.get("timestamp"),
-                            "text": result.get("text", ""),
-                            "score": result.get("score"),
-                            "method": "fts",
-                        }
-                    )
-
-        if not display_results:
-            console.print("[yellow]No results found[/yellow]")
-            return
-        
-        console.print(f"\n[green]Found {len(display_results)} results:[/green]\n")
-        
-        for i, result in enumerate(display_results, 1):
-            timestamp = datetime.fromtimestamp(result["timestamp"])
-            score_line = ""
-            raw_score = result.get("score")
-            if raw_score is not None:
-                if result["method"] == "semantic":
-                    score_label = "Similarity"
-                    display_score = raw_score
-                else:
-                    score_label = "Relevance"
-                    display_score = 1 / (1 + raw_score) if raw_score >= 0 else raw_score
-                score_line = f"\n[dim]{score_label}: {display_score:.3f}[/dim]"
-            
-            panel = Panel(
-                f"[bold]{result['window_title']}[/bold]\n"
-                f"[dim]{result['app_name']} • {timestamp.strftime('%Y-%m-%d %H:%M:%S')}[/dim]{score_line}\n\n"
-                f"{result['text'][:200]}{'...' if len(result['text']) > 200 else ''}",
-                title=f"Result {i}",
-                border_style="cyan",
-            )
-            console.print(panel)
-        
-        db.close()
-        
-    except Exception as e:
-        console.print(f"[red]Error searching: {e}[/red]")
-        import traceback
-        traceback.print_exc()
-
-
-@main.command()
-@click.option("--date", help="Date to convert (YYYY-MM-DD). If not provided, converts yesterday.")
-@click.option("--keep-frames", is_flag=True, help="Keep original frames after conversion")
-def convert_to_video(date: Optional[str], keep_frames: bool):
-    """Convert captured frames to H.264 video for storage efficiency."""
-    from datetime import datetime, timedelta
-    from .video.simple_video_capture import VideoConverter
-    
-    # Parse date or use yesterday
-    if date:
-        try:
-            target_date = datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
-            console.print(f"[red]Invalid date format. Use YYYY-MM-DD[/red]")
-            return
-    else:
-        target_date = datetime.now() - timedelta(days=1)
-    
-    console.print(f"[cyan]Converting frames from {target_date.strftime('%Y-%m-%d')} to H.264 video...[/cyan]")
-    
-    # Create converter
-    config = Config()
-    if keep_frames:
-        config.set("video.delete_frames_after_conversion", False)
-    else:
-        config.set("video.delete_frames_after_conversion", True)
-    
-    converter = VideoConverter(config)
-    
-    # Check ffmpeg
-    if not converter._check_ffmpeg_available():
-        console.print("[red]ffmpeg is not installed. Install with: brew install ffmpeg[/red]")
-        return
-    
-    # Convert
-    async def do_conversion():
-        result = await converter.convert_day_to_video(target_date)
-        if result:
-            console.print(f"[green]✓ Video created: {result}[/green]")
-            if not keep_frames:
-                console.print(f"[yellow]Original frames deleted to save space[/yellow]")
-        else:
-            console.print(f"[red]✗ Conversion failed[/red]")
-    
-    try:
-        asyncio.run(do_conversion())
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-
-
 @main.command()
 def health():
     """Check system health."""
+    from rich.table import Table
+
+    _configure_logging()
+
     console.print("[cyan]Checking system health...[/cyan]\n")
     
     checks = []
@@ -458,28 +501,32 @@ def health():
         checks.append(("Service Status", "✗ Not running", "yellow"))
     
     # Check OpenAI API key
-    if os.getenv("OPENAI_API_KEY"):
+    if _HAS_OPENAI:
         checks.append(("OpenAI API Key", "✓ Configured", "green"))
     else:
         checks.append(("OpenAI API Key", "✗ Not found", "red"))
     
     # Check database
     try:
-        db = Database()
-        db.close()
+        _db()
         checks.append(("Database", "✓ Accessible", "green"))
     except Exception as e:
         checks.append(("Database", f"✗ Error: {e}", "red"))
     
     # Check disk space
     try:
-        import psutil
         config = Config()
         frames_dir = config.get_frames_dir()
         # Create directory if it doesn't exist
         frames_dir.mkdir(parents=True, exist_ok=True)
-        disk = psutil.disk_usage(str(frames_dir))
-        free_gb = disk.free / (1024 ** 3)
+        if os.name == "nt":
+            import shutil
+
+            free_bytes = shutil.disk_usage(frames_dir).free
+        else:
+            st = os.statvfs(frames_dir)
+            free_bytes = st.f_bavail * st.f_frsize
+        free_gb = free_bytes / (1024 ** 3)
         
         if free_gb > config.get("capture.min_free_space_gb", 10):
             checks.append(("Disk Space", f"✓ {free_gb:.1f} GB free", "green"))
@@ -531,134 +578,7 @@ def ui(port: int):
         console.print("[yellow]Make sure streamlit is installed: pip install streamlit[/yellow]")
 
 
-@main.command()
-@click.option("--host", default="127.0.0.1", show_default=True)
-@click.option("--port", default=8000, show_default=True, type=int)
-@click.option("--no-open", is_flag=True, help="Do not open the browser automatically")
-def timeline(host: str, port: int, no_open: bool):
-    """Launch the timeline visualization server (React UI)."""
-    try:
-        from uvicorn import Config as UvicornConfig, Server as UvicornServer
-    except ImportError as exc:
-        console.print("[red]uvicorn is not installed. Please install with `pip install uvicorn`.[/red]")
-        raise click.ClickException(str(exc))
-
-    from .api.server import create_app
-
-    app = create_app()
-    config = UvicornConfig(app=app, host=host, port=port, log_level="info")
-    server = UvicornServer(config)
-
-    url = f"http://{host}:{port}"
-    console.print(f"[green]Timeline server available at {url}[/green]")
-    console.print("[dim]Press Ctrl+C to stop[/dim]")
-
-    if not no_open:
-        import webbrowser
-
-        try:
-            webbrowser.open(url)
-        except Exception:
-            console.print("[yellow]Unable to open browser automatically[/yellow]")
-
-    try:
-        asyncio.run(server.serve())
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Shutting down timeline server...[/yellow]")
-
-
-@main.command()
-@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
-def reset(yes: bool):
-    """Reset Second Brain by deleting all captured data and database."""
-    import shutil
-    
-    console.print("[yellow]Second Brain Reset[/yellow]\n")
-    console.print("This will delete ALL captured data including:")
-    console.print("  • Screenshots and frames")
-    console.print("  • SQLite database")
-    console.print("  • Video files")
-    console.print("  • Embeddings")
-    console.print("  • Logs")
-    console.print(f"\n[red]WARNING: This action cannot be undone![/red]\n")
-    
-    # Prompt for confirmation unless --yes flag is used
-    if not yes:
-        confirmation = click.prompt(
-            "Type 'yes' to confirm reset",
-            type=str,
-            default="no"
-        )
-        if confirmation.lower() != "yes":
-            console.print("[yellow]Reset cancelled.[/yellow]")
-            return
-    
-    console.print("\n[yellow]Checking if service is running...[/yellow]")
-    
-    # Stop service if running
-    if is_running():
-        console.print("[yellow]Stopping Second Brain service...[/yellow]")
-        pid_file = get_pid_file()
-        try:
-            pid, _ = _read_pid_file(pid_file)
-            os.kill(pid, signal.SIGTERM)
-            
-            # Wait for process to stop
-            import time
-            for _ in range(10):
-                if not is_running():
-                    break
-                time.sleep(0.5)
-            
-            if is_running():
-                console.print("[red]Warning: Service may still be running[/red]")
-            else:
-                console.print("[green]✓[/green] Service stopped")
-        except Exception as e:
-            console.print(f"[yellow]Warning: {e}[/yellow]")
-            remove_pid()
-    else:
-        console.print("[green]✓[/green] Service not running")
-    
-    console.print()
-    
-    # Get data directory
-    config = Config()
-    data_dir = config.get_data_dir()
-    
-    if not data_dir.exists():
-        console.print("[yellow]Data directory does not exist, nothing to remove[/yellow]")
-        console.print("[green]✓ Reset complete![/green]")
-        return
-    
-    console.print(f"[yellow]Removing data directory: {data_dir}[/yellow]")
-    
-    # Remove specific subdirectories
-    dirs_to_remove = [
-        ("frames", config.get_frames_dir()),
-        ("videos", data_dir / "videos"),
-        ("database", config.get_database_dir()),
-        ("embeddings", config.get_embeddings_dir()),
-        ("logs", config.get_logs_dir()),
-    ]
-    
-    for name, dir_path in dirs_to_remove:
-        if dir_path.exists():
-            console.print(f"  • Removing {name}...")
-            try:
-                shutil.rmtree(dir_path)
-            except Exception as e:
-                console.print(f"[red]    Error removing {name}: {e}[/red]")
-    
-    # Remove PID file
-    pid_file = get_pid_file()
-    if pid_file.exists():
-        console.print("  • Removing PID file...")
-        pid_file.unlink()
-    
-    console.print(f"\n[green]✓ Reset complete![/green]")
-    console.print("\nYou can now start fresh with: [cyan]second-brain start[/cyan]")
-
-
 if __name__ == "__main__":
-    main()
+    # Run through the importable module so lazily loaded commands, which
+    # import it, share its state
+    importlib.import_module(__spec__.name).main()
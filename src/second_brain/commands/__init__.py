@@ -0,0 +1,5 @@
+"""CLI commands loaded on demand by the second-brain command group.
+
+Each module defines one click command, named after the module, that is only
+imported when that command is invoked.
+"""
@@ -0,0 +1,220 @@
+"""Search captured memory from the command line."""
+
+import contextlib
+import functools
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+import click
+
+from ..cli import _TIMESTAMP_FORMAT, _configure_logging, _db, console
+
+if TYPE_CHECKING:
+    from ..database import Database
+    from ..embeddings import EmbeddingService
+
+# Characters of block text shown per query result
+_RESULT_PREVIEW_CHARS = 200
+# Full-text searches returning more results than this show a spinner
+_SPINNER_MIN_LIMIT = 50
+
+
+@functools.cache
+def _embedding_service() -> "EmbeddingService":
+    """Load the embedding service on first use and reuse it afterwards."""
+    # Lazy import heavy dependencies only when needed
+    from ..embeddings import EmbeddingService
+
+    return EmbeddingService()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_ymd(value: str) -> int:
+    """Parse a YYYY-MM-DD date into a Unix timestamp at local midnight."""
+    return int(datetime.fromisoformat(value).timestamp())
+
+
+def _format_score_line(method: str, raw_score: Optional[float]) -> str:
+    """Format the score line shown under a query result."""
+    if raw_score is None:
+        return ""
+    if method == "semantic":
+        return f"\n[dim]Similarity: {raw_score:.3f}[/dim]"
+    display_score = 1 / (1 + raw_score) if raw_score >= 0 else raw_score
+    return f"\n[dim]Relevance: {display_score:.3f}[/dim]"
+
+
+def _format_result_body(result: Dict[str, Any]) -> str:
+    """Format the panel body for a normalized query result."""
+    timestamp = datetime.fromtimestamp(result["timestamp"]).strftime(_TIMESTAMP_FORMAT)
+    score_line = _format_score_line(result["method"], result["score"])
+    text = result["text"]
+    # Text is read at most one character past the preview length
+    if len(text) > _RESULT_PREVIEW_CHARS:
+        text = text[:_RESULT_PREVIEW_CHARS] + "..."
+    return (
+        f"[bold]{result['window_title']}[/bold]\n"
+        f"[dim]{result['app_name']} • {timestamp}[/dim]{score_line}\n\n"
+        f"{text}"
+    )
+
+
+def _iter_results(
+    db: "Database",
+    query: str,
+    app: Optional[str],
+    start_timestamp: Optional[int],
+    end_timestamp: Optional[int],
+    limit: int,
+    semantic: bool,
+) -> Iterator[Dict[str, Any]]:
+    """Yield normalized query results one match at a time.
+
+    Args:
+        db: Database to read frames and text blocks from
+        query: Search query
+        app: Optional app bundle ID filter
+        start_timestamp: Optional start timestamp filter (full-text only)
+        end_timestamp: Optional end timestamp filter (full-text only)
+        limit: Maximum number of results
+        semantic: Use semantic vector search instead of full-text search
+
+    Yields:
+        Result dictionaries with display fields, score and search method
+    """
+    if semantic:
+        matches = _embedding_service().search(
+            query=query,
+            limit=limit,
+            app_filter=app,
+        )
+
+        frames = db.get_frames_by_ids([match["frame_id"] for match in matches])
+        blocks = db.get_text_blocks_by_ids(
+            [match["block_id"] for match in matches],
+            truncate=_RESULT_PREVIEW_CHARS,
+        )
+
+        for match in matches:
+            frame = frames.get(match["frame_id"])
+            if not frame:
+                continue
+            block = blocks.get(match["block_id"])
+            if not block:
+                continue
+            distance = match.get("distance")
+            yield {
+                "window_title": frame.get("window_title") or "Untitled",
+                "app_name": frame.get("app_name") or "Unknown",
+                "timestamp": frame.get("timestamp"),
+                "text": block.get("text", ""),
+                "score": 1 - distance if distance is not None else None,
+                "method": "semantic",
+            }
+    else:
+        results = db.search_text(
+            query=query,
+            app_filter=app,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            truncate=_RESULT_PREVIEW_CHARS,
+        )
+        for result in results:
+            yield {
+                "window_title": result.get("window_title") or "Untitled",
+                "app_name": result.get("app_name") or "Unknown",
+                "timestamp": result.get("timestamp"),
+                "text": result.get("text", ""),
+                "score": result.get("score"),
+                "method": "fts",
+            }
+
+
+@click.command()
+@click.argument("query")
+@click.option("--app", help="Filter by application bundle ID")
+@click.option("--from", "from_date", help="Start date (YYYY-MM-DD)")
+@click.option("--to", "to_date", help="End date (YYYY-MM-DD)")
+@click.option("--limit", default=10, help="Maximum number of results")
+@click.option("--semantic", is_flag=True, help="Use semantic vector search")
+def query(query: str, app: Optional[str], from_date: Optional[str], to_date: Optional[str], limit: int, semantic: bool):
+    """Search captured memory."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    _configure_logging()
+
+    console.print(f"[cyan]Searching for:[/cyan] {query}")
+    
+    # Parse dates
+    start_timestamp = None
+    end_timestamp = None
+    
+    if from_date:
+        try:
+            start_timestamp = _parse_ymd(from_date)
+        except ValueError:
+            console.print(f"[red]Invalid from date format. Use YYYY-MM-DD[/red]")
+            return
+    
+    if to_date:
+        try:
+            end_timestamp = _parse_ymd(to_date)
+        except ValueError:
+            console.print(f"[red]Invalid to date format. Use YYYY-MM-DD[/red]")
+            return
+    
+    # Search database
+    try:
+        db = _db()
+        
+        # The spinner repaints from a refresh thread. Only start it for
+        # searches slow enough to show it (model load for semantic search,
+        # large result sets), and never when piped.
+        if console.is_terminal and (semantic or limit > _SPINNER_MIN_LIMIT):
+            spinner = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            )
+            spinner.add_task(description="Searching...", total=None)
+        else:
+            spinner = contextlib.nullcontext()
+
+        # Each match is formatted straight into its panel as it is fetched,
+        # without collecting the raw and normalized results first
+        with spinner:
+            panels = [
+                Panel(
+                    _format_result_body(result),
+                    title=f"Result {i}",
+                    border_style="cyan",
+                )
+                for i, result in enumerate(
+                    _iter_results(
+                        db,
+                        query,
+                        app,
+                        start_timestamp,
+                        end_timestamp,
+                        limit,
+                        semantic,
+                    ),
+                    1,
+                )
+            ]
+
+        if not panels:
+            console.print("[yellow]No results found[/yellow]")
+            return
+        
+        # Render the header and all results in a single print
+        header = f"\n[green]Found {len(panels)} results:[/green]\n"
+        console.print(Group(header, *panels))
+        
+    except Exception as e:
+        console.print(f"[red]Error searching: {e}[/red]")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,120 @@
+"""Delete all captured data."""
+
+import os
+import signal
+from pathlib import Path
+
+import click
+
+from ..cli import _service_process, _wait_for_exit, console, get_pid_file, remove_pid
+from ..config import Config
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Delete a directory tree using scandir's cached entry types.
+
+    Unlike shutil.rmtree this trusts d_type from the directory listing and
+    does not stat entries, which matters for the very large, flat frames
+    tree.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+@click.command()
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
+def reset(yes: bool):
+    """Reset Second Brain by deleting all captured data and database."""
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    console.print("[yellow]Second Brain Reset[/yellow]\n")
+    console.print("This will delete ALL captured data including:")
+    console.print("  • Screenshots and frames")
+    console.print("  • SQLite database")
+    console.print("  • Video files")
+    console.print("  • Embeddings")
+    console.print("  • Logs")
+    console.print(f"\n[red]WARNING: This action cannot be undone![/red]\n")
+    
+    # Prompt for confirmation unless --yes flag is used
+    if not yes:
+        confirmation = click.prompt(
+            "Type 'yes' to confirm reset",
+            type=str,
+            default="no"
+        )
+        if confirmation.lower() != "yes":
+            console.print("[yellow]Reset cancelled.[/yellow]")
+            return
+    
+    console.print("\n[yellow]Checking if service is running...[/yellow]")
+    
+    # Stop service if running
+    process = _service_process()
+    if process is not None:
+        console.print("[yellow]Stopping Second Brain service...[/yellow]")
+        try:
+            os.kill(process.pid, signal.SIGTERM)
+            _service_process.cache_clear()
+            
+            # Wait for process to stop
+            if _wait_for_exit(process, timeout=5):
+                console.print("[green]✓[/green] Service stopped")
+            else:
+                console.print("[red]Warning: Service may still be running[/red]")
+        except Exception as e:
+            console.print(f"[yellow]Warning: {e}[/yellow]")
+            remove_pid()
+    else:
+        console.print("[green]✓[/green] Service not running")
+    
+    console.print()
+    
+    # Get data directory
+    config = Config()
+    data_dir = config.get_data_dir()
+    
+    if not data_dir.exists():
+        console.print("[yellow]Data directory does not exist, nothing to remove[/yellow]")
+        console.print("[green]✓ Reset complete![/green]")
+        return
+    
+    console.print(f"[yellow]Removing data directory: {data_dir}[/yellow]")
+    
+    # Remove specific subdirectories; file-heavy ones skip per-entry stats
+    dirs_to_remove = [
+        ("frames", config.get_frames_dir(), _fast_rmtree),
+        ("videos", data_dir / "videos", shutil.rmtree),
+        ("database", config.get_database_dir(), shutil.rmtree),
+        ("embeddings", config.get_embeddings_dir(), _fast_rmtree),
+        ("logs", config.get_logs_dir(), shutil.rmtree),
+    ]
+    
+    # The subtrees are disjoint and removal is dominated by unlink(2),
+    # which releases the GIL, so delete them concurrently.
+    existing = [entry for entry in dirs_to_remove if entry[1].exists()]
+    with ThreadPoolExecutor(max_workers=min(len(existing), os.cpu_count() or 1) or 1) as executor:
+        futures = {}
+        for name, dir_path, remove_tree in existing:
+            console.print(f"  • Removing {name}...")
+            futures[executor.submit(remove_tree, dir_path)] = name
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                console.print(f"[red]    Error removing {futures[future]}: {e}[/red]")
+    
+    # Remove PID file
+    pid_file = get_pid_file()
+    if pid_file.exists():
+        console.print("  • Removing PID file...")
+        pid_file.unlink()
+    
+    console.print(f"\n[green]✓ Reset complete![/green]")
+    console.print("\nYou can now start fresh with: [cyan]second-brain start[/cyan]")
@@ -0,0 +1,79 @@
+"""Serve the timeline visualization."""
+
+from typing import TYPE_CHECKING
+
+import click
+
+from ..cli import _configure_logging, console
+
+if TYPE_CHECKING:
+    from uvicorn import Server as UvicornServer
+
+
+def _open_browser_when_ready(server: "UvicornServer", url: str, timeout: float = 10.0) -> None:
+    """Open url in a new browser tab once the uvicorn server has started."""
+    import time
+    import webbrowser
+
+    deadline = time.monotonic() + timeout
+    while not server.started:
+        if time.monotonic() >= deadline or server.should_exit:
+            return
+        time.sleep(0.05)
+
+    try:
+        webbrowser.open_new_tab(url)
+    except Exception:
+        console.print("[yellow]Unable to open browser automatically[/yellow]")
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8000, show_default=True, type=int)
+@click.option("--no-open", is_flag=True, help="Do not open the browser automatically")
+def timeline(host: str, port: int, no_open: bool):
+    """Launch the timeline visualization server (React UI)."""
+    try:
+        from uvicorn import Config as UvicornConfig, Server as UvicornServer
+    except ImportError as exc:
+        console.print("[red]uvicorn is not installed. Please install with `pip install uvicorn`.[/red]")
+        raise click.ClickException(str(exc))
+
+    from ..api.server import create_app
+
+    _configure_logging()
+    app = create_app()
+    # "auto" picks uvloop and httptools when installed (uvicorn[standard])
+    # and falls back to asyncio and h11. Per-request access logging is
+    # skipped for this local, single-user server.
+    config = UvicornConfig(
+        app=app,
+        host=host,
+        port=port,
+        log_level="warning",
+        loop="auto",
+        http="auto",
+        access_log=False,
+    )
+    server = UvicornServer(config)
+
+    url = f"http://{host}:{port}"
+    console.print(f"[green]Timeline server available at {url}[/green]")
+    console.print("[dim]Press Ctrl+C to stop[/dim]")
+
+    if not no_open:
+        import threading
+
+        # Open the browser off the main thread once the server is listening,
+        # so serving isn't delayed and the first request isn't refused
+        threading.Thread(
+            target=_open_browser_when_ready,
+            args=(server, url),
+            daemon=True,
+        ).start()
+
+    try:
+        # Server.run() installs the configured event loop before serving
+        server.run()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Shutting down timeline server...[/yellow]")
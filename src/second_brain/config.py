@@ -1,10 +1,11 @@
 """Configuration management for Second Brain."""
 
-import json
 import os
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+
 # Default configuration
 DEFAULT_CONFIG = {
     "capture": {
@@ -35,6 +36,17 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Default locations, resolved once at import
+_DATA_DIR = Path.home() / "Library" / "Application Support" / "second-brain"
+_FRAMES_DIR = _DATA_DIR / "frames"
+_DATABASE_DIR = _DATA_DIR / "database"
+_EMBEDDINGS_DIR = _DATA_DIR / "embeddings"
+_LOGS_DIR = _DATA_DIR / "logs"
+_CONFIG_PATH = _DATA_DIR / "config" / "settings.json"
+
+# Cache marker for keys that resolve to nothing
+_MISSING = object()
+
 
 class Config:
     """Configuration manager for Second Brain."""
@@ -47,52 +59,55 @@ class Config:
         """
         self.config_path = config_path or self.get_default_config_path()
         self.config = self._load_config()
+        # Resolved values by dotted key; cleared whenever a value is set
+        self._get_cache: Dict[str, Any] = {}
 
     @staticmethod
     def get_default_config_path() -> Path:
         """Get default configuration file path."""
-        return Path.home() / "Library" / "Application Support" / "second-brain" / "config" / "settings.json"
+        return _CONFIG_PATH
 
     @staticmethod
     def get_data_dir() -> Path:
         """Get data directory path."""
-        return Path.home() / "Library" / "Application Support" / "second-brain"
+        return _DATA_DIR
 
     @staticmethod
     def get_frames_dir() -> Path:
         """Get frames directory path."""
-        return Config.get_data_dir() / "frames"
+        return _FRAMES_DIR
 
     @staticmethod
     def get_database_dir() -> Path:
         """Get database directory path."""
-        return Config.get_data_dir() / "database"
+        return _DATABASE_DIR
 
     @staticmethod
     def get_embeddings_dir() -> Path:
         """Get embeddings directory path."""
-        return Config.get_data_dir() / "embeddings"
+        return _EMBEDDINGS_DIR
 
     @staticmethod
     def get_logs_dir() -> Path:
         """Get logs directory path."""
-        return Config.get_data_dir() / "logs"
+        return _LOGS_DIR
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default."""
-        if self.config_path.exists():
-            with open(self.config_path, "r") as f:
-                user_config = json.load(f)
-                # Merge with defaults
-                config = DEFAULT_CONFIG.copy()
-                self._deep_merge(config, user_config)
-                return config
-        else:
+        try:
+            user_config = orjson.loads(self.config_path.read_bytes())
+        except FileNotFoundError:
             # Create default config
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w") as f:
-                json.dump(DEFAULT_CONFIG, f, indent=2)
+            self.config_path.write_bytes(
+                orjson.dumps(DEFAULT_CONFIG, option=orjson.OPT_INDENT_2)
+            )
             return DEFAULT_CONFIG.copy()
+        
+        # Merge with defaults
+        config = DEFAULT_CONFIG.copy()
+        self._deep_merge(config, user_config)
+        return config
 
     def _deep_merge(self, base: Dict, update: Dict) -> None:
         """Deep merge update dict into base dict."""
@@ -112,14 +127,18 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        return value
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self.config
+            for k in key.split("."):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._get_cache[key] = value
+        return default if value is _MISSING else value
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value by dot-notation key.
@@ -128,6 +147,7 @@ class Config:
             key: Configuration key in dot notation (e.g., 'capture.fps')
             value: Value to set
         """
+        self._get_cache.clear()
         keys = key.split(".")
         config = self.config
         for k in keys[:-1]:
@@ -139,21 +159,28 @@ class Config:
     def save(self) -> None:
         """Save configuration to file."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            json.dump(self.config, f, indent=2)
+        self.config_path.write_bytes(
+            orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        )
 
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        directories = [
-            self.get_data_dir(),
+        data_dir = self.get_data_dir()
+        data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Create the rest shallowest first, so each one's parent already
+        # exists and mkdir doesn't walk the shared ancestors again
+        directories = {
             self.get_frames_dir(),
             self.get_database_dir(),
             self.get_embeddings_dir(),
             self.get_logs_dir(),
             self.config_path.parent,
-        ]
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        }
+        for directory in sorted(directories, key=lambda p: len(p.parts)):
+            directory.mkdir(
+                parents=not directory.is_relative_to(data_dir), exist_ok=True
+            )
 
 
 # Global config instance
@@ -1,38 +1,143 @@
 """Database interface for Second Brain."""
 
+import re
 import sqlite3
+import threading
+import time
 import zlib
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import structlog
+import zstandard
 
 from ..config import Config
 
 logger = structlog.get_logger()
 
+# Stay safely below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_MAX_IN_PARAMS = 900
+
+# Compressed text is stored as a one-byte dictionary id followed by a zstd
+# frame; id 0 means no dictionary. Blobs without the zstd magic after the id
+# byte are legacy zlib streams.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 3
+_ZSTD_DICT_SIZE = 64 * 1024
+# Recent text blocks sampled to train a dictionary, and the fewest worth it
+_ZSTD_DICT_SAMPLES = 1000
+_ZSTD_DICT_MIN_SAMPLES = 100
+# Text blocks longer than this get a compressed copy alongside the plain
+# text readers use; shorter ones would add more to the file than they save
+_COMPRESS_MIN_CHARS = 500
+
+_SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+# Longest window tracking updates are held in memory before being written
+_WINDOW_FLUSH_INTERVAL_SECONDS = 60.0
+
+# Prepared statements kept per connection. Filtered queries are built from
+# clause combinations, so there are more distinct SQL strings than methods.
+_CACHED_STATEMENTS = 256
+
+# stats_cache keys and the tables whose rows they count
+_CACHED_COUNT_TABLES = {
+    "frame_count": "frames",
+    "text_block_count": "text_blocks",
+    "window_count": "windows",
+}
+
+# Columns read back by the get methods. Text blocks leave out the
+# text_compressed copy unless it is asked for.
+_FRAME_COLUMNS = (
+    "frame_id, timestamp, window_title, app_bundle_id, app_name, file_path, "
+    "file_size_bytes, screen_resolution, created_at"
+)
+_TEXT_BLOCK_COLUMNS = (
+    "block_id, frame_id, text, normalized_text, confidence, "
+    "bbox_x, bbox_y, bbox_width, bbox_height, block_type, created_at"
+)
+_SUMMARY_COLUMNS = (
+    "summary_id, start_timestamp, end_timestamp, summary_type, summary_text, "
+    "frame_count, app_names, created_at"
+)
+
+# Text block columns for previews; the text is cut down in SQL by a bound
+# substr() length
+_TEXT_BLOCK_PREVIEW_COLUMNS = (
+    "block_id, frame_id, substr(text, 1, ?) AS text, confidence, "
+    "bbox_x, bbox_y, bbox_width, bbox_height, block_type"
+)
+
 
 class Database:
     """SQLite database interface for Second Brain."""
 
-    def __init__(self, db_path: Optional[Path] = None, config: Optional[Config] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        config: Optional[Config] = None,
+        read_only: bool = False,
+    ):
         """Initialize database connection.
         
         Args:
             db_path: Path to database file. If None, uses default location.
             config: Configuration instance. If None, uses global config.
+            read_only: Open an existing database for queries only. Skips schema
+                setup and never takes write locks.
         """
         self.config = config or Config()
         self.db_path = db_path or (self.config.get_database_dir() / "memory.db")
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.read_only = read_only
         self.conn: Optional[sqlite3.Connection] = None
-        self._initialize_db()
+        # Nesting depth of transaction() blocks
+        self._transaction_depth = 0
+        # Nesting depth of bulk_ingest_mode() blocks
+        self._bulk_ingest_depth = 0
+        # Decompressors by dictionary id, loaded on first use
+        self._zstd_decompressors: Dict[int, zstandard.ZstdDecompressor] = {}
+        if read_only:
+            self._open_read_only()
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._initialize_db()
+            self._zstd_dict_id, self._zstd_dict = self._load_or_train_zstd_dict()
+            # Text blocks inserted since training last came up empty
+            self._blocks_since_dict_attempt = 0
+            # zstd compressors are not thread-safe, so each thread gets its own
+            self._zstd_local = threading.local()
+            # Text blocks are compressed off the writer thread. zstd releases
+            # the GIL, and the finished blobs are written back on the next
+            # insert or at close so the connection stays on its own thread.
+            self._compress_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="text-compress"
+            )
+            self._pending_compressions: List[Tuple[str, Future]] = []
+            # (app_bundle_id, app_name) -> (first_seen, last_seen) not yet
+            # written, and the app seen most recently
+            self._window_buffer: Dict[Tuple[str, str], Tuple[int, int]] = {}
+            self._last_window: Optional[Tuple[str, str]] = None
+            self._windows_flushed_at = time.monotonic()
 
     def _initialize_db(self) -> None:
         """Initialize database with schema."""
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Connections may be closed from a different thread than the one that
+        # used them (e.g. API shutdown), so don't pin them to the opener.
+        self.conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
         self.conn.row_factory = sqlite3.Row
         
+        # Larger pages mean shallower B-trees. The page size can only be
+        # chosen before the first table exists and WAL mode is enabled.
+        if self.conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            self.conn.execute("PRAGMA page_size = 8192")
+        
         # Enable foreign keys
         self.conn.execute("PRAGMA foreign_keys = ON")
         
@@ -43,19 +148,74 @@ class Database:
         self.conn.execute("PRAGMA synchronous = NORMAL")  # Faster writes
         self.conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
         self.conn.execute("PRAGMA temp_store = MEMORY")  # Use memory for temp tables
+        self.conn.execute("PRAGMA mmap_size = 268435456")  # 256MB memory-mapped reads
+        self.conn.execute("PRAGMA wal_autocheckpoint = 1000")  # Checkpoint every 1000 pages
+        
+        self._migrate_schema()
         
         # Load and execute schema
-        schema_path = Path(__file__).parent / "schema.sql"
-        with open(schema_path, "r") as f:
+        with open(_SCHEMA_PATH, "r") as f:
             schema = f.read()
         self.conn.executescript(schema)
         self.conn.commit()
+        self._seed_cached_counts()
         
         logger.info("database_initialized", db_path=str(self.db_path), wal_mode=True)
 
+    def _migrate_schema(self) -> None:
+        """Drop schema objects that schema.sql now defines differently.
+        
+        schema.sql only creates what is missing, so objects whose definition
+        changed are dropped here first and recreated by the script. Checking
+        sqlite_master keeps opens from rewriting the schema every time.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE name IN "
+            "('text_blocks_au', 'idx_frames_app', 'idx_frames_timestamp', 'idx_frames_app_timestamp')"
+        )
+        for name, sql in cursor.fetchall():
+            if name == "text_blocks_au" and "UPDATE OF" not in sql:
+                # Reindexed FTS on any update, including text_compressed
+                cursor.execute("DROP TRIGGER text_blocks_au")
+            elif name.startswith("idx_frames_"):
+                # Superseded by the (..., timestamp, frame_id) keyset indexes
+                cursor.execute(f"DROP INDEX {name}")
+        self.conn.commit()
+
+    def _open_read_only(self) -> None:
+        """Open a query-only connection to an existing database."""
+        self.conn = sqlite3.connect(
+            f"{self.db_path.as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        self.conn.row_factory = sqlite3.Row
+        
+        self.conn.execute("PRAGMA query_only = ON")
+        self.conn.execute("PRAGMA mmap_size = 268435456")  # 256MB memory-mapped reads
+        self.conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        
+        logger.debug("database_opened_read_only", db_path=str(self.db_path))
+
     def close(self) -> None:
         """Close database connection."""
         if self.conn:
+            if not self.read_only:
+                self._compress_pool.shutdown(wait=True)
+                try:
+                    self._store_compressed_text(wait=True)
+                    self._flush_windows()
+                    self.conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning("text_compression_store_failed", error=str(e))
+                # Refresh query planner statistics for tables that need it
+                try:
+                    self.conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.warning("database_optimize_failed", error=str(e))
             self.conn.close()
             self.conn = None
 
@@ -67,29 +227,256 @@ class Database:
         """Context manager exit."""
         self.close()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into a single transaction.
+        
+        The outermost block runs BEGIN IMMEDIATE and commits once on exit, so a
+        batch of inserts pays for one commit. Nested blocks use savepoints, so
+        a failing inner block only rolls back its own writes. Write methods
+        called outside any block still commit on their own. Finished text
+        compressions are written just before the outermost commit, so a
+        rolled-back savepoint can't take them with it.
+        """
+        if self._transaction_depth == 0:
+            if self.conn.in_transaction:
+                self.conn.commit()
+            self.conn.execute("BEGIN IMMEDIATE")
+        else:
+            self.conn.execute(f"SAVEPOINT sp{self._transaction_depth}")
+        
+        depth = self._transaction_depth
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth = depth
+            if depth == 0:
+                self.conn.rollback()
+            else:
+                self.conn.execute(f"ROLLBACK TO sp{depth}")
+                self.conn.execute(f"RELEASE sp{depth}")
+            raise
+        
+        self._transaction_depth = depth
+        if depth == 0:
+            stored: List[Tuple[str, Future]] = []
+            try:
+                if not self.read_only:
+                    stored = self._store_compressed_text()
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                # Retry the compressed copies with a later write
+                self._pending_compressions.extend(stored)
+                raise
+        else:
+            self.conn.execute(f"RELEASE sp{depth}")
+
+    @contextmanager
+    def bulk_ingest_mode(self) -> Iterator[None]:
+        """Defer full-text indexing while backfilling text blocks.
+        
+        The FTS insert trigger is dropped for the duration of the block, then
+        restored and the whole index rebuilt in one pass on exit, which is
+        much faster than updating the index row by row. The trigger is
+        dropped for every connection, so this is for offline backfill only,
+        not while the capture service is writing. Nested blocks leave the
+        work to the outermost one.
+        """
+        if self._bulk_ingest_depth:
+            self._bulk_ingest_depth += 1
+            try:
+                yield
+            finally:
+                self._bulk_ingest_depth -= 1
+            return
+        
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'text_blocks_ai'"
+        )
+        row = cursor.fetchone()
+        if row is None:
+            # An earlier bulk run died before restoring it
+            logger.warning("fts_insert_trigger_missing")
+            with open(_SCHEMA_PATH, "r") as f:
+                trigger_sql = re.search(
+                    r"CREATE TRIGGER IF NOT EXISTS text_blocks_ai\b.*?\bEND;",
+                    f.read(),
+                    re.DOTALL,
+                ).group(0)
+        else:
+            trigger_sql = row[0]
+            cursor.execute("DROP TRIGGER text_blocks_ai")
+            self._commit()
+        self._bulk_ingest_depth = 1
+        logger.info("bulk_ingest_started")
+        
+        try:
+            yield
+        finally:
+            self._bulk_ingest_depth = 0
+            cursor.execute(trigger_sql)
+            cursor.execute("INSERT INTO text_blocks_fts(text_blocks_fts) VALUES ('rebuild')")
+            self._commit()
+            logger.info("bulk_ingest_finished")
+
+    def _commit(self) -> None:
+        """Commit, unless a transaction() block will commit on exit."""
+        if self._transaction_depth == 0:
+            self.conn.commit()
+
     # Compression helpers
     
+    def _load_or_train_zstd_dict(
+        self,
+    ) -> Tuple[int, Optional[zstandard.ZstdCompressionDict]]:
+        """Load the newest zstd dictionary.
+        
+        If no dictionary exists yet, one is trained from a sample of stored
+        text blocks once there are enough of them; insert_text_blocks retries
+        until then. Short OCR strings compress
+        far better against a shared dictionary than on their own.
+        
+        Returns:
+            Dictionary id and dictionary, or (0, None) if there is none yet
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT dict_id, data FROM compression_dicts ORDER BY dict_id DESC LIMIT 1"
+        )
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute(
+                "SELECT text FROM text_blocks ORDER BY rowid DESC LIMIT ?",
+                (_ZSTD_DICT_SAMPLES,),
+            )
+            samples = [r[0].encode("utf-8") for r in cursor.fetchall() if r[0]]
+            if len(samples) < _ZSTD_DICT_MIN_SAMPLES:
+                return 0, None
+            try:
+                trained = zstandard.train_dictionary(_ZSTD_DICT_SIZE, samples)
+            except zstandard.ZstdError as e:
+                logger.warning("zstd_dict_training_failed", error=str(e))
+                return 0, None
+            cursor.execute(
+                "INSERT INTO compression_dicts (data) VALUES (?)",
+                (trained.as_bytes(),),
+            )
+            self._commit()
+            row = (cursor.lastrowid, trained.as_bytes())
+            logger.info("zstd_dict_trained", dict_id=row[0], samples=len(samples))
+        
+        dict_id, data = row
+        dict_data = zstandard.ZstdCompressionDict(data)
+        self._zstd_decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=dict_data)
+        return dict_id, dict_data
+
+    def _retry_zstd_dict_training(self) -> None:
+        """Train the zstd dictionary if enough text blocks arrived since the last try.
+        
+        Must not run inside a transaction() block, whose rollback could drop
+        the dictionary row while compressed blobs still reference it.
+        """
+        if self._blocks_since_dict_attempt < _ZSTD_DICT_MIN_SAMPLES:
+            return
+        self._blocks_since_dict_attempt = 0
+        # Let running compressions finish so none mixes the old compressor
+        # with the new dictionary id
+        self._store_compressed_text(wait=True)
+        self._commit()
+        dict_id, dict_data = self._load_or_train_zstd_dict()
+        if dict_data is not None:
+            self._zstd_dict_id, self._zstd_dict = dict_id, dict_data
+            # Drop the per-thread compressors built without the dictionary
+            self._zstd_local = threading.local()
+
+    def _get_zstd_decompressor(self, dict_id: int) -> zstandard.ZstdDecompressor:
+        """Get the decompressor for a dictionary id, loading it if needed."""
+        decompressor = self._zstd_decompressors.get(dict_id)
+        if decompressor is None:
+            dict_data = None
+            if dict_id:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "SELECT data FROM compression_dicts WHERE dict_id = ?", (dict_id,)
+                )
+                dict_data = zstandard.ZstdCompressionDict(cursor.fetchone()[0])
+            decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+            self._zstd_decompressors[dict_id] = decompressor
+        return decompressor
+
     def _compress_text(self, text: str) -> bytes:
-        """Compress text using zlib.
+        """Compress text using zstd with the shared dictionary.
         
         Args:
             text: Text to compress
             
         Returns:
-            Compressed bytes
+            Dictionary id byte followed by the compressed frame
+        """
+        compressor = getattr(self._zstd_local, "compressor", None)
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(
+                level=_ZSTD_LEVEL, dict_data=self._zstd_dict
+            )
+            self._zstd_local.compressor = compressor
+        return bytes((self._zstd_dict_id,)) + compressor.compress(text.encode("utf-8"))
+
+    def _compress_if_smaller(self, text: str) -> Optional[bytes]:
+        """Compress text, or return None if compression doesn't save space."""
+        compressed = self._compress_text(text)
+        if len(compressed) >= len(text.encode("utf-8")):
+            return None
+        return compressed
+
+    def _store_compressed_text(self, wait: bool = False) -> List[Tuple[str, Future]]:
+        """Write finished background compressions to their text blocks.
+        
+        The caller commits. Must not run inside a savepoint, whose rollback
+        would silently discard the updates.
+        
+        Args:
+            wait: Also wait for compressions that are still running
+            
+        Returns:
+            The pending entries written, to requeue if the commit fails
         """
-        return zlib.compress(text.encode('utf-8'), level=6)
+        done = []
+        pending = []
+        for entry in self._pending_compressions:
+            if wait or entry[1].done():
+                done.append(entry)
+            else:
+                pending.append(entry)
+        
+        ready = [
+            (compressed, block_id)
+            for block_id, future in done
+            if (compressed := future.result()) is not None
+        ]
+        if ready:
+            self.conn.executemany(
+                "UPDATE text_blocks SET text_compressed = ? WHERE block_id = ?",
+                ready,
+            )
+        self._pending_compressions = pending
+        return done
     
     def _decompress_text(self, compressed: bytes) -> str:
         """Decompress text.
         
         Args:
-            compressed: Compressed bytes
+            compressed: Compressed bytes (zstd with dictionary id, or legacy zlib)
             
         Returns:
             Decompressed text
         """
-        return zlib.decompress(compressed).decode('utf-8')
+        if compressed[1:5] != _ZSTD_MAGIC:
+            return zlib.decompress(compressed).decode("utf-8")
+        decompressor = self._get_zstd_decompressor(compressed[0])
+        return decompressor.decompress(compressed[1:]).decode("utf-8")
 
     # Frame operations
     
@@ -118,7 +505,7 @@ class Database:
             frame_data.get("file_size_bytes"),
             frame_data.get("screen_resolution"),
         ))
-        self.conn.commit()
+        self._commit()
         
         logger.debug("frame_inserted", frame_id=frame_data["frame_id"])
         return frame_data["frame_id"]
@@ -133,10 +520,25 @@ class Database:
             Frame data dictionary or None if not found
         """
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM frames WHERE frame_id = ?", (frame_id,))
+        cursor.execute(
+            f"SELECT {_FRAME_COLUMNS} FROM frames WHERE frame_id = ?", (frame_id,)
+        )
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def get_frames_by_ids(self, frame_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several frames in bulk.
+        
+        Args:
+            frame_ids: Frame identifiers to look up
+            
+        Returns:
+            Mapping of frame_id to frame data for the frames that exist
+        """
+        return self._get_rows_by_ids(
+            "frames", "frame_id", frame_ids, columns=_FRAME_COLUMNS
+        )
+
     def get_frames_by_timerange(
         self, start_timestamp: int, end_timestamp: int, limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -151,14 +553,64 @@ class Database:
             List of frame dictionaries
         """
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM frames
+        cursor.execute(f"""
+            SELECT {_FRAME_COLUMNS} FROM frames
             WHERE timestamp BETWEEN ? AND ?
             ORDER BY timestamp DESC
             LIMIT ?
         """, (start_timestamp, end_timestamp, limit))
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_frames_before(
+        self,
+        before_timestamp: int,
+        limit: int = 100,
+        app_bundle_id: Optional[str] = None,
+        before_frame_id: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the page of frames preceding a position, newest first.
+        
+        Pass the timestamp and frame_id of the last frame of one page to get
+        the next. The (timestamp, frame_id) indexes return each page already
+        in order, however deep it is.
+        
+        Args:
+            before_timestamp: Return frames older than this timestamp
+            limit: Maximum number of frames to return
+            app_bundle_id: Optional application bundle identifier filter
+            before_frame_id: Frame at before_timestamp to continue after, so
+                frames sharing its timestamp aren't skipped
+            start_timestamp: Optional oldest timestamp to return
+            
+        Returns:
+            List of frame dictionaries
+        """
+        if before_frame_id is None:
+            sql = f"SELECT {_FRAME_COLUMNS} FROM frames WHERE timestamp < ?"
+            params: List[Any] = [before_timestamp]
+        else:
+            sql = (
+                f"SELECT {_FRAME_COLUMNS} FROM frames "
+                "WHERE (timestamp, frame_id) < (?, ?)"
+            )
+            params = [before_timestamp, before_frame_id]
+        
+        if app_bundle_id:
+            sql += " AND app_bundle_id = ?"
+            params.append(app_bundle_id)
+        
+        if start_timestamp:
+            sql += " AND timestamp >= ?"
+            params.append(start_timestamp)
+        
+        sql += " ORDER BY timestamp DESC, frame_id DESC LIMIT ?"
+        params.append(limit)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return [dict(row) for row in cursor.fetchall()]
+
     def get_frames_by_app(
         self, app_bundle_id: str, limit: int = 100
     ) -> List[Dict[str, Any]]:
@@ -172,8 +624,8 @@ class Database:
             List of frame dictionaries
         """
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM frames
+        cursor.execute(f"""
+            SELECT {_FRAME_COLUMNS} FROM frames
             WHERE app_bundle_id = ?
             ORDER BY timestamp DESC
             LIMIT ?
@@ -183,7 +635,11 @@ class Database:
     # Text block operations
     
     def insert_text_blocks(self, text_blocks: List[Dict[str, Any]]) -> int:
-        """Insert multiple text blocks with compression.
+        """Insert multiple text blocks.
+        
+        Blocks longer than _COMPRESS_MIN_CHARS are queued for compression in
+        the background; their compressed copies are stored by a later call
+        or at close.
         
         Args:
             text_blocks: List of text block dictionaries
@@ -192,60 +648,77 @@ class Database:
             Number of blocks inserted
         """
         cursor = self.conn.cursor()
+        compress_queued = 0
         
-        # Prepare data with compression
-        data_to_insert = []
-        for block in text_blocks:
-            text = block["text"]
-            normalized = block.get("normalized_text")
-            
-            # Compress text if it's large enough to benefit (> 500 chars)
-            text_compressed = None
-            if len(text) > 500:
-                text_compressed = self._compress_text(text)
-                # Only use compression if it actually saves space
-                if len(text_compressed) >= len(text.encode('utf-8')):
-                    text_compressed = None
-            
-            data_to_insert.append((
-                block["block_id"],
-                block["frame_id"],
-                text,
-                normalized,
-                text_compressed,
-                block.get("confidence"),
-                block.get("bbox", {}).get("x"),
-                block.get("bbox", {}).get("y"),
-                block.get("bbox", {}).get("width"),
-                block.get("bbox", {}).get("height"),
-                block.get("block_type"),
-            ))
+        def rows() -> Iterator[Tuple[Any, ...]]:
+            # Rows are bound one at a time as executemany pulls them, and
+            # long blocks start compressing on the pool meanwhile
+            nonlocal compress_queued
+            for block in text_blocks:
+                text = block["text"]
+                if len(text) > _COMPRESS_MIN_CHARS:
+                    future = self._compress_pool.submit(self._compress_if_smaller, text)
+                    self._pending_compressions.append((block["block_id"], future))
+                    compress_queued += 1
+                
+                bbox = block.get("bbox", {})
+                yield (
+                    block["block_id"],
+                    block["frame_id"],
+                    text,
+                    block.get("normalized_text"),
+                    block.get("confidence"),
+                    bbox.get("x"),
+                    bbox.get("y"),
+                    bbox.get("width"),
+                    bbox.get("height"),
+                    block.get("block_type"),
+                )
         
+        # Store compressions finished by earlier calls before queueing more.
+        # Inside a transaction() block they are stored at its commit instead.
+        stored = 0
+        if self._transaction_depth == 0:
+            if self._zstd_dict is None:
+                self._retry_zstd_dict_training()
+            stored = len(self._store_compressed_text())
         cursor.executemany("""
             INSERT INTO text_blocks (
-                block_id, frame_id, text, normalized_text, text_compressed, confidence,
+                block_id, frame_id, text, normalized_text, confidence,
                 bbox_x, bbox_y, bbox_width, bbox_height, block_type
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, data_to_insert)
-        self.conn.commit()
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows())
+        self._commit()
         
         count = len(text_blocks)
-        compressed_count = sum(1 for d in data_to_insert if d[4] is not None)
-        logger.debug("text_blocks_inserted", count=count, compressed=compressed_count)
+        if self._zstd_dict is None:
+            self._blocks_since_dict_attempt += count
+        logger.debug(
+            "text_blocks_inserted",
+            count=count,
+            compress_queued=compress_queued,
+            compressed_stored=stored,
+        )
         return count
 
-    def get_text_blocks_by_frame(self, frame_id: str) -> List[Dict[str, Any]]:
+    def get_text_blocks_by_frame(
+        self, frame_id: str, include_compressed: bool = False
+    ) -> List[Dict[str, Any]]:
         """Get all text blocks for a frame.
         
         Args:
             frame_id: Frame identifier
+            include_compressed: Also read each block's text_compressed copy
             
         Returns:
             List of text block dictionaries
         """
+        columns = _TEXT_BLOCK_COLUMNS
+        if include_compressed:
+            columns += ", text_compressed"
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM text_blocks
+        cursor.execute(f"""
+            SELECT {columns} FROM text_blocks
             WHERE frame_id = ?
             ORDER BY bbox_y, bbox_x
         """, (frame_id,))
@@ -255,12 +728,60 @@ class Database:
         """Get a single text block by ID."""
         cursor = self.conn.cursor()
         cursor.execute(
-            "SELECT * FROM text_blocks WHERE block_id = ?",
+            f"SELECT {_TEXT_BLOCK_COLUMNS} FROM text_blocks WHERE block_id = ?",
             (block_id,),
         )
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def get_text_blocks_by_ids(
+        self, block_ids: List[str], truncate: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get several text blocks in bulk.
+        
+        Args:
+            block_ids: Text block identifiers to look up
+            truncate: If set, read only the first truncate + 1 characters of
+                each block's text (enough to tell whether it was cut)
+            
+        Returns:
+            Mapping of block_id to text block data for the blocks that exist
+        """
+        if truncate is None:
+            return self._get_rows_by_ids(
+                "text_blocks", "block_id", block_ids, columns=_TEXT_BLOCK_COLUMNS
+            )
+        return self._get_rows_by_ids(
+            "text_blocks",
+            "block_id",
+            block_ids,
+            columns=_TEXT_BLOCK_PREVIEW_COLUMNS,
+            column_params=[truncate + 1],
+        )
+
+    def _get_rows_by_ids(
+        self,
+        table: str,
+        key_column: str,
+        ids: List[str],
+        columns: str = "*",
+        column_params: Optional[List[Any]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch rows keyed by primary key using chunked IN queries."""
+        unique_ids = list(dict.fromkeys(ids))
+        rows: Dict[str, Dict[str, Any]] = {}
+        cursor = self.conn.cursor()
+        for start in range(0, len(unique_ids), _MAX_IN_PARAMS):
+            chunk = unique_ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT {columns} FROM {table} WHERE {key_column} IN ({placeholders})",
+                (column_params or []) + chunk,
+            )
+            for row in cursor.fetchall():
+                rows[row[key_column]] = dict(row)
+        return rows
+
     def get_frames(
         self,
         limit: int = 500,
@@ -269,8 +790,8 @@ class Database:
         end_timestamp: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Retrieve frames with optional filtering."""
-        sql = """
-            SELECT *
+        sql = f"""
+            SELECT {_FRAME_COLUMNS}
             FROM frames
         """
         clauses: List[str] = []
@@ -291,7 +812,8 @@ class Database:
         if clauses:
             sql += " WHERE " + " AND ".join(clauses)
 
-        sql += " ORDER BY timestamp DESC LIMIT ?"
+        # Same order as get_frames_before, so a page's last frame is its cursor
+        sql += " ORDER BY timestamp DESC, frame_id DESC LIMIT ?"
         params.append(limit)
 
         cursor = self.conn.cursor()
@@ -307,6 +829,7 @@ class Database:
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
         limit: int = 50,
+        truncate: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Full-text search across text blocks.
         
@@ -316,33 +839,29 @@ class Database:
             start_timestamp: Optional start timestamp filter
             end_timestamp: Optional end timestamp filter
             limit: Maximum number of results
+            truncate: If set, read only the first truncate + 1 characters of
+                each matching block's text
             
         Returns:
             List of search results with frame and text block data
         """
-        # Build query with filters
-        sql = """
-            SELECT 
-                f.frame_id,
-                f.timestamp,
-                f.window_title,
-                f.app_bundle_id,
-                f.app_name,
-                f.file_path,
-                tb.block_id,
-                tb.text,
-                tb.confidence,
-                tb.bbox_x,
-                tb.bbox_y,
-                tb.bbox_width,
-                tb.bbox_height,
-                bm25(text_blocks_fts) AS score
-            FROM text_blocks_fts
-            JOIN text_blocks tb ON text_blocks_fts.rowid = tb.rowid
-            JOIN frames f ON tb.frame_id = f.frame_id
-            WHERE text_blocks_fts MATCH ?
-        """
-        
+        # Rank matches inside FTS5 first. ORDER BY rank with a LIMIT lets
+        # FTS5 keep only the top hits, and base tables are only joined when
+        # a filter needs frame columns.
+        if app_filter or start_timestamp or end_timestamp:
+            sql = """
+                SELECT text_blocks_fts.rowid, text_blocks_fts.rank
+                FROM text_blocks_fts
+                JOIN text_blocks tb ON text_blocks_fts.rowid = tb.rowid
+                JOIN frames f ON tb.frame_id = f.frame_id
+                WHERE text_blocks_fts MATCH ?
+            """
+        else:
+            sql = """
+                SELECT rowid, rank
+                FROM text_blocks_fts
+                WHERE text_blocks_fts MATCH ?
+            """
         params: List[Any] = [query]
         
         if app_filter:
@@ -357,13 +876,50 @@ class Database:
             sql += " AND f.timestamp <= ?"
             params.append(end_timestamp)
         
-        sql += " ORDER BY score, f.timestamp DESC LIMIT ?"
+        sql += " ORDER BY rank LIMIT ?"
         params.append(limit)
         
         cursor = self.conn.cursor()
         cursor.execute(sql, params)
+        scores = dict(cursor.fetchall())
+        
+        # Hydrate only the ranked hits
+        text_column = "tb.text" if truncate is None else "substr(tb.text, 1, ?)"
+        column_params = [] if truncate is None else [truncate + 1]
+        rows = self._get_rows_by_ids(
+            "text_blocks tb JOIN frames f ON tb.frame_id = f.frame_id",
+            "tb.rowid",
+            list(scores),
+            columns=f"""
+                tb.rowid AS "tb.rowid",
+                f.frame_id,
+                f.timestamp,
+                f.window_title,
+                f.app_bundle_id,
+                f.app_name,
+                f.file_path,
+                tb.block_id,
+                {text_column} AS text,
+                tb.confidence,
+                tb.bbox_x,
+                tb.bbox_y,
+                tb.bbox_width,
+                tb.bbox_height
+            """,
+            column_params=column_params,
+        )
+        
+        results = []
+        for rowid, score in scores.items():
+            row = rows.get(rowid)
+            if row is None:
+                continue
+            del row["tb.rowid"]
+            row["score"] = score
+            results.append(row)
+        # Newer frames first among equally ranked hits
+        results.sort(key=lambda r: (r["score"], -r["timestamp"]))
         
-        results = [dict(row) for row in cursor.fetchall()]
         logger.debug("text_search_completed", query=query, results=len(results))
         return results
 
@@ -374,19 +930,43 @@ class Database:
     ) -> None:
         """Update window tracking for an application.
         
+        Updates are coalesced in memory and written when the foreground app
+        changes, every _WINDOW_FLUSH_INTERVAL_SECONDS, or at close.
+        
         Args:
             app_bundle_id: Application bundle identifier
             app_name: Application name
             timestamp: Current timestamp
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        key = (app_bundle_id, app_name)
+        app_changed = self._last_window is not None and key != self._last_window
+        self._last_window = key
+        
+        first_seen, _ = self._window_buffer.get(key, (timestamp, timestamp))
+        self._window_buffer[key] = (first_seen, timestamp)
+        
+        if app_changed or (
+            time.monotonic() - self._windows_flushed_at >= _WINDOW_FLUSH_INTERVAL_SECONDS
+        ):
+            self._flush_windows()
+            self._commit()
+    
+    def _flush_windows(self) -> None:
+        """Write buffered window tracking updates."""
+        self._windows_flushed_at = time.monotonic()
+        if not self._window_buffer:
+            return
+        self.conn.executemany("""
             INSERT INTO windows (app_bundle_id, app_name, first_seen, last_seen)
             VALUES (?, ?, ?, ?)
             ON CONFLICT(app_bundle_id, app_name) DO UPDATE SET
-                last_seen = ?
-        """, (app_bundle_id, app_name, timestamp, timestamp, timestamp))
-        self.conn.commit()
+                last_seen = excluded.last_seen
+        """, [
+            (app_bundle_id, app_name, first_seen, last_seen)
+            for (app_bundle_id, app_name), (first_seen, last_seen)
+            in self._window_buffer.items()
+        ])
+        self._window_buffer.clear()
 
     def get_app_usage_stats(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get application usage statistics.
@@ -397,6 +977,9 @@ class Database:
         Returns:
             List of app usage statistics
         """
+        if not self.read_only:
+            self._flush_windows()
+            self._commit()
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT 
@@ -421,17 +1004,13 @@ class Database:
         Returns:
             Dictionary with database statistics
         """
+        if not self.read_only:
+            self._flush_windows()
+            self._commit()
         cursor = self.conn.cursor()
         
         # Get counts
-        cursor.execute("SELECT COUNT(*) FROM frames")
-        frame_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM text_blocks")
-        text_block_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM windows")
-        window_count = cursor.fetchone()[0]
+        counts = self._get_cached_counts()
         
         # Get database size
         cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
@@ -442,14 +1021,64 @@ class Database:
         oldest, newest = cursor.fetchone()
         
         return {
-            "frame_count": frame_count,
-            "text_block_count": text_block_count,
-            "window_count": window_count,
+            "frame_count": counts["frame_count"],
+            "text_block_count": counts["text_block_count"],
+            "window_count": counts["window_count"],
             "database_size_bytes": db_size,
             "oldest_frame_timestamp": oldest,
             "newest_frame_timestamp": newest,
         }
 
+    def _get_cached_counts(self) -> Dict[str, int]:
+        """Get table row counts from the trigger-maintained stats cache.
+        
+        Counts missing from the cache are computed once and stored; after that
+        the schema triggers keep them exact without rescanning the tables.
+        
+        Returns:
+            Mapping of count name to row count
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("SELECT key, value FROM stats_cache")
+            counts = {row["key"]: row["value"] for row in cursor.fetchall()}
+        except sqlite3.OperationalError:
+            # Read-only connection to a database created before the cache
+            counts = {}
+        
+        missing = [key for key in _CACHED_COUNT_TABLES if key not in counts]
+        if missing and not self.read_only:
+            self._seed_cached_counts()
+            return self._get_cached_counts()
+        for key in missing:
+            # Read-only connections cannot seed the cache; count directly
+            cursor.execute(f"SELECT COUNT(*) FROM {_CACHED_COUNT_TABLES[key]}")
+            counts[key] = cursor.fetchone()[0]
+        return counts
+
+    def _seed_cached_counts(self) -> None:
+        """Store the row counts missing from the stats cache.
+        
+        Runs when a writer opens, so read-only connections (like the CLI's
+        status) find the counts there; the schema triggers keep them exact
+        from then on.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT key FROM stats_cache")
+        cached = {row[0] for row in cursor.fetchall()}
+        for key, table in _CACHED_COUNT_TABLES.items():
+            if key in cached:
+                continue
+            # Count and store in one statement so no concurrent insert is missed
+            cursor.execute(
+                f"""
+                INSERT OR IGNORE INTO stats_cache (key, value, updated_at)
+                SELECT ?, COUNT(*), strftime('%s', 'now') FROM {table}
+                """,
+                (key,),
+            )
+        self._commit()
+
     def cleanup_old_frames(self, retention_days: int) -> int:
         """Delete frames older than retention period.
         
@@ -465,7 +1094,7 @@ class Database:
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM frames WHERE timestamp < ?", (cutoff_timestamp,))
         deleted = cursor.rowcount
-        self.conn.commit()
+        self._commit()
         
         logger.info("old_frames_cleaned", deleted=deleted, retention_days=retention_days)
         return deleted
@@ -501,28 +1130,31 @@ class Database:
             summary_data.get("frame_count"),
             summary_data.get("app_names"),
         ))
-        self.conn.commit()
+        self._commit()
         
         logger.debug("summary_inserted", summary_id=summary_data["summary_id"])
         return summary_data["summary_id"]
     
     def get_summaries_for_day(self, date: datetime) -> List[Dict[str, Any]]:
-        """Get all summaries for a specific day.
+        """Get all summaries that start on a specific day.
         
         Args:
-            date: Date to get summaries for
+            date: Date to get summaries for, in its own (or local) time zone
             
         Returns:
             List of summary dictionaries
         """
-        from datetime import datetime
-        start_ts = int(date.replace(hour=0, minute=0, second=0).timestamp())
-        end_ts = int(date.replace(hour=23, minute=59, second=59).timestamp())
+        # Bound by the next midnight rather than 23:59:59 of the same day, so
+        # the last hour's summary (ending at midnight) and 23- or 25-hour DST
+        # days are covered
+        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_ts = int(day_start.timestamp())
+        end_ts = int((day_start + timedelta(days=1)).timestamp())
         
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM summaries
-            WHERE start_timestamp >= ? AND end_timestamp <= ?
+        cursor.execute(f"""
+            SELECT {_SUMMARY_COLUMNS} FROM summaries
+            WHERE start_timestamp >= ? AND start_timestamp < ?
             ORDER BY start_timestamp ASC
         """, (start_ts, end_ts))
         
@@ -538,8 +1170,8 @@ class Database:
             Summary dictionary or None
         """
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM summaries
+        cursor.execute(f"""
+            SELECT {_SUMMARY_COLUMNS} FROM summaries
             WHERE summary_type = ?
             ORDER BY end_timestamp DESC
             LIMIT 1
@@ -20,7 +20,7 @@ CREATE TABLE IF NOT EXISTS text_blocks (
     frame_id TEXT NOT NULL,
     text TEXT NOT NULL,
     normalized_text TEXT,
-    text_compressed BLOB,  -- zlib compressed text for storage efficiency
+    text_compressed BLOB,  -- zstd compressed text for storage efficiency
     confidence REAL,
     bbox_x INTEGER,
     bbox_y INTEGER,
@@ -62,15 +62,60 @@ CREATE TRIGGER IF NOT EXISTS text_blocks_ad AFTER DELETE ON text_blocks BEGIN
     DELETE FROM text_blocks_fts WHERE rowid = old.rowid;
 END;
 
-CREATE TRIGGER IF NOT EXISTS text_blocks_au AFTER UPDATE ON text_blocks BEGIN
+-- Only reindex when indexed columns change, not when text_compressed is
+-- filled in
+CREATE TRIGGER IF NOT EXISTS text_blocks_au
+AFTER UPDATE OF block_id, frame_id, text, normalized_text ON text_blocks BEGIN
     DELETE FROM text_blocks_fts WHERE rowid = old.rowid;
     INSERT INTO text_blocks_fts(rowid, block_id, frame_id, text, normalized_text)
     VALUES (new.rowid, new.block_id, new.frame_id, new.text, new.normalized_text);
 END;
 
+-- zstd dictionaries for text block compression, trained from stored text.
+-- Compressed blobs start with the id of the dictionary they were made with.
+CREATE TABLE IF NOT EXISTS compression_dicts (
+    dict_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data BLOB NOT NULL,
+    created_at INTEGER DEFAULT (strftime('%s', 'now'))
+);
+
+-- Cached row counts for status reporting. Rows are seeded with a full count
+-- on first use and kept exact by the triggers below.
+CREATE TABLE IF NOT EXISTS stats_cache (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS frames_count_ai AFTER INSERT ON frames BEGIN
+    UPDATE stats_cache SET value = value + 1, updated_at = strftime('%s', 'now') WHERE key = 'frame_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS frames_count_ad AFTER DELETE ON frames BEGIN
+    UPDATE stats_cache SET value = value - 1, updated_at = strftime('%s', 'now') WHERE key = 'frame_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS text_blocks_count_ai AFTER INSERT ON text_blocks BEGIN
+    UPDATE stats_cache SET value = value + 1, updated_at = strftime('%s', 'now') WHERE key = 'text_block_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS text_blocks_count_ad AFTER DELETE ON text_blocks BEGIN
+    UPDATE stats_cache SET value = value - 1, updated_at = strftime('%s', 'now') WHERE key = 'text_block_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS windows_count_ai AFTER INSERT ON windows BEGIN
+    UPDATE stats_cache SET value = value + 1, updated_at = strftime('%s', 'now') WHERE key = 'window_count';
+END;
+
+CREATE TRIGGER IF NOT EXISTS windows_count_ad AFTER DELETE ON windows BEGIN
+    UPDATE stats_cache SET value = value - 1, updated_at = strftime('%s', 'now') WHERE key = 'window_count';
+END;
+
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_frames_timestamp ON frames(timestamp);
-CREATE INDEX IF NOT EXISTS idx_frames_app ON frames(app_bundle_id);
+-- Time-ordered scans, with frame_id breaking ties for keyset pagination
+CREATE INDEX IF NOT EXISTS idx_frames_timestamp_id ON frames(timestamp, frame_id);
+-- The same per app
+CREATE INDEX IF NOT EXISTS idx_frames_app_timestamp_id ON frames(app_bundle_id, timestamp, frame_id);
 CREATE INDEX IF NOT EXISTS idx_frames_created ON frames(created_at);
 CREATE INDEX IF NOT EXISTS idx_text_blocks_frame ON text_blocks(frame_id);
 CREATE INDEX IF NOT EXISTS idx_text_blocks_confidence ON text_blocks(confidence);
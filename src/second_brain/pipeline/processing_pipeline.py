@@ -125,53 +125,61 @@ class ProcessingPipeline:
                 # Run OCR on batch
                 results = await self.ocr_service.process_batch(image_paths)
                 
-                # Store results in database
-                for (frame_path, metadata), text_blocks in zip(batch, results):
-                    try:
-                        # Insert frame metadata
-                        self.database.insert_frame(metadata)
-                        
-                        # Insert text blocks if any
-                        if text_blocks:
-                            self.database.insert_text_blocks(text_blocks)
-                            # Index embeddings after successful DB write
-                            try:
-                                self.embedding_service.index_text_blocks(metadata, text_blocks)
-                            except Exception as embed_error:
-                                # Only log as error if it's not a known compatibility issue
-                                error_str = str(embed_error)
-                                if "cached_download" in error_str or "url" in error_str:
-                                    # Silently skip embedding for compatibility issues
-                                    pass
-                                else:
-                                    logger.error(
-                                        "embedding_index_failed",
-                                        frame_id=metadata["frame_id"],
-                                        error=error_str,
-                                    )
-                        
-                        # Update window tracking
-                        self.database.update_window_tracking(
-                            metadata["app_bundle_id"],
-                            metadata["app_name"],
-                            metadata["timestamp"],
-                        )
-                        
-                        self.stats["frames_processed"] += 1
-                        
-                        logger.info(
-                            "frame_processed",
-                            frame_id=metadata["frame_id"],
-                            text_blocks=len(text_blocks),
-                        )
-                        
-                    except Exception as e:
-                        self.stats["frames_failed"] += 1
-                        logger.error(
-                            "frame_storage_failed",
-                            frame_id=metadata["frame_id"],
-                            error=str(e),
-                        )
+                # Store the whole batch in one transaction; each frame gets a
+                # savepoint so a failure only rolls back that frame's rows
+                stored: List[tuple[Dict[str, Any], List[Dict[str, Any]]]] = []
+                with self.database.transaction():
+                    for (frame_path, metadata), text_blocks in zip(batch, results):
+                        try:
+                            with self.database.transaction():
+                                # Insert frame metadata
+                                self.database.insert_frame(metadata)
+                                
+                                # Insert text blocks if any
+                                if text_blocks:
+                                    self.database.insert_text_blocks(text_blocks)
+                                
+                                # Update window tracking
+                                self.database.update_window_tracking(
+                                    metadata["app_bundle_id"],
+                                    metadata["app_name"],
+                                    metadata["timestamp"],
+                                )
+                        except Exception as e:
+                            self.stats["frames_failed"] += 1
+                            logger.error(
+                                "frame_storage_failed",
+                                frame_id=metadata["frame_id"],
+                                error=str(e),
+                            )
+                            continue
+                        stored.append((metadata, text_blocks))
+                
+                for metadata, text_blocks in stored:
+                    # Index embeddings after successful DB write
+                    if text_blocks:
+                        try:
+                            self.embedding_service.index_text_blocks(metadata, text_blocks)
+                        except Exception as embed_error:
+                            # Only log as error if it's not a known compatibility issue
+                            error_str = str(embed_error)
+                            if "cached_download" in error_str or "url" in error_str:
+                                # Silently skip embedding for compatibility issues
+                                pass
+                            else:
+                                logger.error(
+                                    "embedding_index_failed",
+                                    frame_id=metadata["frame_id"],
+                                    error=error_str,
+                                )
+                    
+                    self.stats["frames_processed"] += 1
+                    
+                    logger.info(
+                        "frame_processed",
+                        frame_id=metadata["frame_id"],
+                        text_blocks=len(text_blocks),
+                    )
                 
             except Exception as e:
                 self.stats["frames_failed"] += len(batch)
@@ -10,6 +10,7 @@ import os
 import time
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import structlog
 
@@ -21,6 +22,45 @@ from ..database import Database
 logger = structlog.get_logger()
 
 
+_SESSION_PROMPT_TEMPLATE = """Summarize this work session.
+
+Activity log:
+{context_text}
+
+Provide a brief 2-3 sentence summary."""
+
+_PROMPT_TEMPLATES = {
+    "hourly": """Summarize this hour of screen activity. Be concise but insightful. 
+Focus on:
+- Main tasks/activities
+- Applications used
+- Key accomplishments or patterns
+
+Activity log:
+{context_text}
+
+Provide a 2-3 sentence summary.""",
+    "daily": """Summarize this day's screen activity. Provide an insightful overview.
+Focus on:
+- Major tasks and projects worked on
+- Time allocation across different activities
+- Key accomplishments
+- Productivity patterns
+
+Activity log:
+{context_text}
+
+Provide a comprehensive 4-5 sentence summary.""",
+    "session": _SESSION_PROMPT_TEMPLATE,
+}
+
+
+@lru_cache(maxsize=1440)
+def _clock_label(minute: int) -> str:
+    """Format a unix minute (timestamp // 60) as a local HH:MM label."""
+    return datetime.fromtimestamp(minute * 60).strftime("%H:%M")
+
+
 class SummarizationService:
     """Service for generating AI summaries of captured activity."""
     
@@ -79,45 +119,17 @@ class SummarizationService:
         
         # Prepare context
         context_items = []
-        for i, (block, frame) in enumerate(zip(text_blocks[:50], frames[:50])):  # Limit to 50 for token management
-            ts = datetime.fromtimestamp(frame['timestamp'])
+        for block, frame in zip(text_blocks[:50], frames[:50]):  # Limit to 50 for token management
+            label = _clock_label(frame['timestamp'] // 60)
             app = frame.get('app_name', 'Unknown')
             text = block.get('text', '')[:300]  # Limit text length
-            context_items.append(f"[{ts.strftime('%H:%M')}] {app}: {text}")
+            context_items.append(f"[{label}] {app}: {text}")
         
         context_text = "\n".join(context_items)
         
         # Create prompt based on summary type
-        if summary_type == "hourly":
-            prompt = f"""Summarize this hour of screen activity. Be concise but insightful. 
-Focus on:
-- Main tasks/activities
-- Applications used
-- Key accomplishments or patterns
-
-Activity log:
-{context_text}
-
-Provide a 2-3 sentence summary."""
-        elif summary_type == "daily":
-            prompt = f"""Summarize this day's screen activity. Provide an insightful overview.
-Focus on:
-- Major tasks and projects worked on
-- Time allocation across different activities
-- Key accomplishments
-- Productivity patterns
-
-Activity log:
-{context_text}
-
-Provide a comprehensive 4-5 sentence summary."""
-        else:
-            prompt = f"""Summarize this work session.
-
-Activity log:
-{context_text}
-
-Provide a brief 2-3 sentence summary."""
+        template = _PROMPT_TEMPLATES.get(summary_type, _SESSION_PROMPT_TEMPLATE)
+        prompt = template.format(context_text=context_text)
         
         try:
             response = await self.client.chat.completions.create(
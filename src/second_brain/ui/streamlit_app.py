@@ -72,8 +72,12 @@ class SecondBrainUI:
             st.error("Database not found. Please start Second Brain first.")
             st.stop()
         
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Read-only, so queries run alongside the capture service's writes
+        # under WAL without taking locks
+        self.conn = sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True)
         self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA query_only = ON")
+        self.conn.execute("PRAGMA mmap_size = 268435456")
     
     def get_daily_stats(self, date: datetime) -> Dict[str, Any]:
         """Get statistics for a specific day."""
@@ -7,16 +7,21 @@ This uses a hybrid approach:
 """
 
 import asyncio
+import fcntl
 import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
+import orjson
 import structlog
 
 from ..config import Config
 
 logger = structlog.get_logger()
 
+# Extensions the capture service writes frames with, for any capture.format
+_FRAME_SUFFIXES = {".png", ".jpg", ".jpeg", ".heic", ".tiff", ".webp"}
+
 
 class VideoConverter:
     """Converts captured frames to H.264 video segments using ffmpeg."""
@@ -170,8 +175,10 @@ class VideoConverter:
             logger.warning("day_directory_not_found", date=date.strftime("%Y-%m-%d"))
             return None
         
-        # Find all image files (png or webp)
-        frame_files = sorted(day_dir.glob("*.png")) + sorted(day_dir.glob("*.webp"))
+        # Find all frames; HH-MM-SS-mmm names sort chronologically
+        frame_files = sorted(
+            path for path in day_dir.iterdir() if path.suffix.lower() in _FRAME_SUFFIXES
+        )
         
         if not frame_files:
             logger.warning("no_frames_found", date=date.strftime("%Y-%m-%d"))
@@ -188,15 +195,56 @@ class VideoConverter:
         if success:
             # Optionally delete original frames to save space
             if self.config.get("video.delete_frames_after_conversion", False):
+                deleted = set()
                 for frame_file in frame_files:
                     try:
                         frame_file.unlink()
-                        # Also delete corresponding JSON
-                        json_file = frame_file.with_suffix('.json')
-                        json_file.unlink(missing_ok=True)
+                        deleted.add(frame_file.name)
                     except Exception as e:
                         logger.error("failed_to_delete_frame", file=str(frame_file), error=str(e))
+                self._prune_metadata_shard(day_dir, deleted)
             
             return output_path
         
         return None
+
+    def _prune_metadata_shard(self, day_dir: Path, deleted: Set[str]) -> None:
+        """Drop deleted frames from the day's NDJSON metadata shard.
+        
+        The shard is rewritten in place under the same lock the capture
+        service appends with, so lines appended meanwhile are kept. It is
+        emptied rather than removed once the day has no frames left, since the
+        capture service may still hold it open for appending. Lines that do
+        not parse are dropped.
+        
+        Args:
+            day_dir: Day directory holding the frames and frames.ndjson
+            deleted: File names of the frames that were deleted
+        """
+        shard_path = day_dir / "frames.ndjson"
+        try:
+            shard = open(shard_path, "r+b")
+        except FileNotFoundError:
+            return
+        
+        with shard:
+            fcntl.flock(shard.fileno(), fcntl.LOCK_EX)
+            if not any(
+                path.suffix.lower() in _FRAME_SUFFIXES for path in day_dir.iterdir()
+            ):
+                shard.truncate(0)
+                logger.info("metadata_shard_emptied", shard=str(shard_path))
+                return
+            
+            kept = []
+            for line in shard:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if Path(entry.get("file_path", "")).name not in deleted:
+                    kept.append(line)
+            shard.seek(0)
+            shard.writelines(kept)
+            shard.truncate()
+            logger.info("metadata_shard_pruned", shard=str(shard_path), kept=len(kept))
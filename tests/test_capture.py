@@ -1,8 +1,9 @@
 """Tests for capture service."""
 
+import json
 import stat
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -71,9 +72,10 @@ def test_capture_service_initialization(capture_service):
 @pytest.mark.asyncio
 async def test_capture_frame(capture_service, tmp_path):
     """Test single frame capture."""
-    # Mock screencapture command
-    with patch('subprocess.run') as mock_run:
-        mock_run.return_value = Mock(returncode=0)
+    # Force the screencapture fallback and mock the command
+    with patch.object(capture_service, '_grab_display_image', return_value=None), \
+            patch('asyncio.create_subprocess_exec', new_callable=AsyncMock) as mock_exec:
+        mock_exec.return_value = Mock(wait=AsyncMock(return_value=0))
         
         # Mock file creation
         with patch.object(Path, 'stat') as mock_stat:
@@ -90,6 +92,19 @@ async def test_capture_frame(capture_service, tmp_path):
             assert "file_path" in metadata
 
 
+def test_metadata_shard_appends_lines(capture_service, tmp_path):
+    """Test frame metadata is appended to a single NDJSON shard per day."""
+    date_dir = tmp_path / "2024" / "01" / "01"
+    date_dir.mkdir(parents=True)
+
+    capture_service._append_metadata(date_dir, {"frame_id": "a"})
+    capture_service._append_metadata(date_dir, {"frame_id": "b"})
+    capture_service._close_meta_shard()
+
+    lines = (date_dir / "frames.ndjson").read_text().splitlines()
+    assert [json.loads(line)["frame_id"] for line in lines] == ["a", "b"]
+
+
 def test_get_stats(capture_service):
     """Test getting capture statistics."""
     stats = capture_service.get_stats()
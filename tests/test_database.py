@@ -1,6 +1,7 @@
 """Tests for database layer."""
 
 import pytest
+import sqlite3
 import tempfile
 from pathlib import Path
 
@@ -52,6 +53,29 @@ def test_insert_frame(temp_db):
     assert frame["window_title"] == "Test Window"
 
 
+def test_get_frames_before_pages_by_timestamp(temp_db):
+    """Test keyset pagination over frames, including shared timestamps."""
+    for i in range(5):
+        temp_db.insert_frame({
+            "frame_id": f"frame-{i}",
+            "timestamp": 1000 + i // 2,
+            "app_bundle_id": "com.test.app" if i % 2 else "com.other.app",
+            "file_path": f"frame-{i}.png",
+            "screen_resolution": "1920x1080",
+        })
+    
+    first = temp_db.get_frames_before(2000, limit=2)
+    assert [f["frame_id"] for f in first] == ["frame-4", "frame-3"]
+    last = first[-1]
+    second = temp_db.get_frames_before(
+        last["timestamp"], limit=2, before_frame_id=last["frame_id"]
+    )
+    assert [f["frame_id"] for f in second] == ["frame-2", "frame-1"]
+    
+    app_frames = temp_db.get_frames_before(2000, app_bundle_id="com.test.app")
+    assert [f["frame_id"] for f in app_frames] == ["frame-3", "frame-1"]
+
+
 def test_insert_text_blocks(temp_db):
     """Test inserting text blocks."""
     # First insert a frame
@@ -89,6 +113,167 @@ def test_insert_text_blocks(temp_db):
     assert blocks[0]["text"] == "Hello world"
 
 
+def test_text_compression_round_trip(temp_db):
+    """Test zstd compression with a trained dictionary and legacy zlib blobs."""
+    import zlib
+
+    text = "Quarterly report draft - Google Docs " * 20
+    assert temp_db._decompress_text(temp_db._compress_text(text)) == text
+    assert temp_db._decompress_text(zlib.compress(text.encode("utf-8"))) == text
+
+    temp_db.conn.execute(
+        "INSERT INTO frames (frame_id, timestamp, file_path, screen_resolution) "
+        "VALUES ('f', 1, 'f.png', '1x1')"
+    )
+    temp_db.insert_text_blocks([
+        {
+            "block_id": f"block-{i}",
+            "frame_id": "f",
+            "text": f"Inbox ({i}) - mail@example.com - Gmail message {i * 7919}",
+            "normalized_text": "",
+            "confidence": 0.9,
+            "bbox": {},
+            "block_type": "text",
+        }
+        for i in range(500)
+    ] + [
+        {
+            "block_id": "long-block",
+            "frame_id": "f",
+            "text": text,
+            "normalized_text": "",
+            "confidence": 0.9,
+            "bbox": {},
+            "block_type": "text",
+        }
+    ])
+
+    # Long blocks get a compressed copy in the background
+    temp_db._store_compressed_text(wait=True)
+    temp_db.conn.commit()
+    row = temp_db.conn.execute(
+        "SELECT text_compressed FROM text_blocks WHERE block_id = 'long-block'"
+    ).fetchone()
+    assert temp_db._decompress_text(row[0]) == text
+    assert temp_db.search_text("Quarterly")[0]["block_id"] == "long-block"
+
+    # Once enough blocks are stored, the next insert trains a dictionary
+    assert temp_db._zstd_dict is None
+    temp_db.insert_text_blocks([
+        {
+            "block_id": "after-training",
+            "frame_id": "f",
+            "text": text + "!",
+            "bbox": {},
+        }
+    ])
+    temp_db._store_compressed_text(wait=True)
+    temp_db.conn.commit()
+    row = temp_db.conn.execute(
+        "SELECT text_compressed FROM text_blocks WHERE block_id = 'after-training'"
+    ).fetchone()
+    assert row[0][0] == temp_db._zstd_dict_id > 0
+    assert temp_db._decompress_text(row[0]) == text + "!"
+
+    # Reopening loads the stored dictionary
+    db = Database(db_path=temp_db.db_path)
+    reader = Database(db_path=temp_db.db_path, read_only=True)
+    try:
+        compressed = db._compress_text(text)
+        assert compressed[0] > 0
+        assert db._decompress_text(compressed) == text
+        # Other connections load the dictionary on demand
+        assert reader._decompress_text(compressed) == text
+    finally:
+        reader.close()
+        db.close()
+
+
+def test_bulk_lookups_by_id(temp_db):
+    """Test fetching frames and text blocks by ID in bulk."""
+    for i in range(3):
+        temp_db.insert_frame({
+            "frame_id": f"frame-{i}",
+            "timestamp": 1234567890 + i,
+            "window_title": f"Window {i}",
+            "app_bundle_id": "com.test.app",
+            "app_name": "Test App",
+            "file_path": f"2025/10/26/{i}.png",
+        })
+    temp_db.insert_text_blocks([
+        {
+            "block_id": f"block-{i}",
+            "frame_id": f"frame-{i}",
+            "text": f"Block {i}",
+        }
+        for i in range(3)
+    ])
+    
+    frames = temp_db.get_frames_by_ids(["frame-0", "frame-2", "frame-2", "missing"])
+    assert set(frames) == {"frame-0", "frame-2"}
+    assert frames["frame-2"]["window_title"] == "Window 2"
+    
+    blocks = temp_db.get_text_blocks_by_ids(["block-1", "missing"])
+    assert set(blocks) == {"block-1"}
+    assert blocks["block-1"]["text"] == "Block 1"
+    
+    truncated = temp_db.get_text_blocks_by_ids(["block-1"], truncate=3)
+    assert truncated["block-1"]["text"] == "Bloc"
+    
+    assert temp_db.get_frames_by_ids([]) == {}
+
+
+def test_transaction_batches_and_rolls_back_nested_block(temp_db):
+    """Test nested transaction blocks roll back independently of the batch."""
+    with temp_db.transaction():
+        temp_db.insert_frame({
+            "frame_id": "kept",
+            "timestamp": 1234567890,
+            "file_path": "2009/02/13/kept.png",
+        })
+        with pytest.raises(sqlite3.IntegrityError):
+            with temp_db.transaction():
+                temp_db.insert_frame({
+                    "frame_id": "dropped",
+                    "timestamp": 1234567891,
+                    "file_path": "2009/02/13/dropped.png",
+                })
+                temp_db.insert_text_blocks([
+                    {"block_id": "orphan", "frame_id": "missing", "text": "Orphan"},
+                ])
+        assert temp_db.conn.in_transaction
+    
+    assert not temp_db.conn.in_transaction
+    assert temp_db.get_frame("kept") is not None
+    assert temp_db.get_frame("dropped") is None
+    assert temp_db.get_text_block("orphan") is None
+
+
+def test_compressed_text_survives_rolled_back_savepoint(temp_db):
+    """Test finished compressions aren't lost with a failed nested block."""
+    temp_db.insert_frame({
+        "frame_id": "kept",
+        "timestamp": 1234567890,
+        "file_path": "2009/02/13/kept.png",
+    })
+    temp_db.insert_text_blocks([
+        {"block_id": "long", "frame_id": "kept", "text": "Long block text " * 40},
+    ])
+    temp_db._pending_compressions[0][1].result()
+    
+    with temp_db.transaction():
+        with pytest.raises(sqlite3.IntegrityError):
+            with temp_db.transaction():
+                temp_db.insert_text_blocks([
+                    {"block_id": "orphan", "frame_id": "missing", "text": "Orphan"},
+                ])
+    
+    row = temp_db.conn.execute(
+        "SELECT text_compressed FROM text_blocks WHERE block_id = 'long'"
+    ).fetchone()
+    assert temp_db._decompress_text(row[0]) == "Long block text " * 40
+
+
 def test_search_text(temp_db):
     """Test full-text search."""
     # Insert test data
@@ -121,6 +306,66 @@ def test_search_text(temp_db):
     results = temp_db.search_text("python")
     assert len(results) > 0
     assert "python" in results[0]["text"].lower()
+    
+    results = temp_db.search_text("python", truncate=6)
+    assert results[0]["text"] == "Python "
+    
+    # Filters on frame columns
+    assert temp_db.search_text("python", app_filter="com.test.app")[0]["block_id"] == "block-1"
+    assert temp_db.search_text("python", app_filter="com.other.app") == []
+    assert temp_db.search_text("python", start_timestamp=1234567891) == []
+
+
+def test_bulk_ingest_mode_rebuilds_search_index(temp_db):
+    """Test text blocks inserted in bulk mode become searchable on exit."""
+    temp_db.insert_frame({
+        "frame_id": "test-frame-1",
+        "timestamp": 1234567890,
+        "file_path": "test.png",
+        "screen_resolution": "1920x1080",
+    })
+    
+    with temp_db.bulk_ingest_mode():
+        temp_db.insert_text_blocks([
+            {
+                "block_id": f"block-{i}",
+                "frame_id": "test-frame-1",
+                "text": f"Backfilled note {i}",
+                "normalized_text": f"backfilled note {i}",
+                "confidence": 0.9,
+                "bbox": {},
+                "block_type": "prose",
+            }
+            for i in range(3)
+        ])
+        assert temp_db.search_text("Backfilled") == []
+    
+    assert len(temp_db.search_text("Backfilled")) == 3
+    
+    # The insert trigger is back for normal writes
+    temp_db.insert_text_blocks([{
+        "block_id": "block-live",
+        "frame_id": "test-frame-1",
+        "text": "Live capture",
+        "bbox": {},
+    }])
+    assert temp_db.search_text("Live capture")[0]["block_id"] == "block-live"
+    
+    # Nested blocks and a trigger lost by a crashed run still end indexed
+    with temp_db.bulk_ingest_mode():
+        with temp_db.bulk_ingest_mode():
+            pass
+        assert temp_db.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'text_blocks_ai'"
+        ).fetchone() is None
+    temp_db.conn.execute("DROP TRIGGER text_blocks_ai")
+    temp_db.conn.execute("DELETE FROM text_blocks_fts")
+    with temp_db.bulk_ingest_mode():
+        pass
+    assert len(temp_db.search_text("Backfilled")) == 3
+    assert temp_db.conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'text_blocks_ai'"
+    ).fetchone() is not None
 
 
 def test_window_tracking(temp_db):
@@ -134,6 +379,21 @@ def test_window_tracking(temp_db):
     stats = temp_db.get_app_usage_stats()
     assert len(stats) > 0
     assert stats[0]["app_name"] == "Test App"
+    
+    # Repeated updates for the same app are coalesced until it changes
+    def stored_last_seen():
+        return dict(temp_db.conn.execute(
+            "SELECT app_bundle_id, last_seen FROM windows"
+        ).fetchall())
+    
+    temp_db.update_window_tracking("com.test.app", "Test App", 1234567891)
+    temp_db.update_window_tracking("com.test.app", "Test App", 1234567892)
+    assert stored_last_seen() == {"com.test.app": 1234567890}
+    temp_db.update_window_tracking("com.other.app", "Other App", 1234567893)
+    assert stored_last_seen() == {
+        "com.test.app": 1234567892,
+        "com.other.app": 1234567893,
+    }
 
 
 def test_cleanup_old_frames(temp_db):
@@ -158,3 +418,77 @@ def test_cleanup_old_frames(temp_db):
     # Verify frame was deleted
     frame = temp_db.get_frame("old-frame")
     assert frame is None
+
+
+def test_database_stats_counts_track_changes(temp_db):
+    """Test cached row counts stay exact across inserts and cascading deletes."""
+    temp_db.insert_frame({
+        "frame_id": "frame-1",
+        "timestamp": 1234567890,
+        "file_path": "2009/02/13/frame-1.png",
+    })
+    # Seeded when the writer opened, so read-only connections just read them
+    cached = dict(temp_db.conn.execute("SELECT key, value FROM stats_cache").fetchall())
+    assert cached == {"frame_count": 1, "text_block_count": 0, "window_count": 0}
+    assert temp_db.get_database_stats()["frame_count"] == 1
+    
+    # Counted by triggers once the cache is seeded
+    temp_db.insert_frame({
+        "frame_id": "frame-2",
+        "timestamp": 1000000000,
+        "file_path": "2001/09/09/frame-2.png",
+    })
+    temp_db.insert_text_blocks([
+        {"block_id": "block-1", "frame_id": "frame-2", "text": "Old text"},
+    ])
+    temp_db.update_window_tracking("com.test.app", "Test App", 1000000000)
+    temp_db.update_window_tracking("com.test.app", "Test App", 1000000001)
+    stats = temp_db.get_database_stats()
+    assert stats["frame_count"] == 2
+    assert stats["text_block_count"] == 1
+    assert stats["window_count"] == 1
+    
+    temp_db.cleanup_old_frames(retention_days=1)
+    stats = temp_db.get_database_stats()
+    assert stats["frame_count"] == 0
+    assert stats["text_block_count"] == 0
+
+
+def test_get_summaries_for_day_includes_last_hour(temp_db):
+    """Test a day's summaries include the hour ending at midnight."""
+    from datetime import datetime
+    
+    day = datetime(2025, 10, 26, 15, 30)
+    late = int(datetime(2025, 10, 26, 23).timestamp())
+    midnight = int(datetime(2025, 10, 27).timestamp())
+    for summary_id, start, end in [
+        ("late", late, midnight),
+        ("next-day", midnight, midnight + 3600),
+    ]:
+        temp_db.insert_summary({
+            "summary_id": summary_id,
+            "start_timestamp": start,
+            "end_timestamp": end,
+            "summary_type": "hourly",
+            "summary_text": "Worked on things",
+        })
+    
+    summaries = temp_db.get_summaries_for_day(day)
+    assert [s["summary_id"] for s in summaries] == ["late"]
+
+
+def test_read_only_connection(temp_db):
+    """Test read-only connections see committed data but cannot write."""
+    temp_db.insert_frame({
+        "frame_id": "test-frame-1",
+        "timestamp": 1234567890,
+        "file_path": "2025/10/26/test.png",
+    })
+    
+    reader = Database(db_path=temp_db.db_path, read_only=True)
+    try:
+        assert reader.get_frame("test-frame-1") is not None
+        with pytest.raises(sqlite3.OperationalError):
+            reader.conn.execute("DELETE FROM frames")
+    finally:
+        reader.close()